@@ -1,20 +1,68 @@
 from astrbot.api import logger
 
 from model import constants
-from model.data_managers import IniFileReader
-from model.city_func import get_by_qq,calculate_delta_days
+from model.data_managers import get_ini_reader,transaction
+from model.city_func import get_by_qq,calculate_delta_days,get_today_str
 
 import time
 from datetime import datetime
 from typing import Dict
-from decimal import Decimal,ROUND_HALF_UP
+
+# 转账成功提示模板（手续费率为常量，在模块加载时格式化一次）
+_FEE_PCT_STR = f"{constants.TRANSFER_PROCESSING_FEE_RATE * 100}"
+_TRANSFER_OK = (
+    "✅ 转账成功！\n"
+    "发送者：{user_name}\n"
+    "接收者：{target_qq}\n"
+    "转账金额：{amount}\n"
+    "手续费（" + _FEE_PCT_STR + "%）：{fee}金币\n"
+    "发送者原余额：{sd} → 新余额：{snd} 金币\n"
+    "接收者原余额：{rd} → 新余额：{rnd} 金币"
+)
+
+_BANK_MENU_STR = ("""✦ 🏦 银 行 服 务 ✦\n———————————\n✨ 基础操作 → 存款 / 取款\n✨ 资金流转 → 贷款 / 还款\n
+    ✨ 定期业务 → 存定期 / 取定期\n✨ 其他功能 → 查存款 / 转账\n——————————\n输入对应关键词使用，如「存款」""")
+
+def _interest(principal: int, rate_num: int, rate_den: int, delta: int, period: int) -> int:
+    """
+    整数计息：本金 × (rate_num / rate_den) × delta / period，四舍五入到整数金币
+    :param principal: 本金
+    :param rate_num: 年利率分子
+    :param rate_den: 年利率分母
+    :param delta: 计息时长（与 period 同单位）
+    :param period: 一年的时长
+    :return: 利息（整数金币）
+    """
+    num = principal * rate_num * delta
+    den = rate_den * period
+    return int((num + den // 2) // den)  # 加半个分母再整除 = ROUND_HALF_UP
+
+def _loan_interest(principal: int, since: float, now: float) -> int:
+    """
+    计算贷款利息：本金 × 年利率 × 时间差秒数 / 一年的总秒数，四舍五入到整数金币
+    全程使用整数运算，时间差按整秒计（兼容旧数据中的浮点时间戳）
+    :param principal: 贷款本金
+    :param since: 最后一次贷款时间戳
+    :param now: 当前时间戳
+    :return: 利息（整数金币）
+    """
+    return _interest(principal, constants.LOAN_RATE_NUM, constants.LOAN_RATE_DEN,
+                     int(now) - int(since), constants.SECONDS_PER_YEAR_INT)
+
+def _fixed_deposit_interest(principal: int, days: int) -> int:
+    """
+    计算定期利息：本金 × 定期年利率 ÷ 360 × 存期天数，四舍五入到整数金币
+    :param principal: 定期本金
+    :param days: 存期天数
+    :return: 利息（整数金币）
+    """
+    return _interest(principal, constants.FIXED_RATE_NUM, constants.FIXED_RATE_DEN, days, constants.DAYS_PER_YEAR)
 
 def bank_menu() -> str:
     """
     返回适合 QQ 群文字游戏的银行菜单（简洁直观，带互动引导）
     """
-    return ("""✦ 🏦 银 行 服 务 ✦\n———————————\n✨ 基础操作 → 存款 / 取款\n✨ 资金流转 → 贷款 / 还款\n
-    ✨ 定期业务 → 存定期 / 取定期\n✨ 其他功能 → 查存款 / 转账\n——————————\n输入对应关键词使用，如「存款」""")
+    return _BANK_MENU_STR
 
 def deposit(account,user_name,msg,path) -> str:
     """
@@ -25,21 +73,20 @@ def deposit(account,user_name,msg,path) -> str:
     :param path:数据目录
     :return: 结果提示
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M")  # 获取当前时间
-
+    base = constants.DEPOSIT_MULTIPLE_BASE  # 金额基数（金额需为其整数倍）
     if not msg.startswith("存款 "):
         return (
             f"{constants.ERROR_PREFIX}\n"
-            f"存款格式应为：存款 [金额]（例：存款 {constants.DEPOSIT_MULTIPLE_BASE}）\n"
-            f"✨ 温馨提示：金额需为{constants.DEPOSIT_MULTIPLE_BASE}的整数倍，"
-            f"如{constants.DEPOSIT_MULTIPLE_BASE}、{constants.DEPOSIT_MULTIPLE_BASE*3}等。"
+            f"存款格式应为：存款 [金额]（例：存款 {base}）\n"
+            f"✨ 温馨提示：金额需为{base}的整数倍，"
+            f"如{base}、{base*3}等。"
         )
     parts = msg.split()
     if len(parts) < 2:
         return (
             f"{constants.ERROR_PREFIX}\n"
             f"信息不完整呢~ 请补充完整的金额\n"
-            f"📝 示例：存款 {constants.DEPOSIT_MULTIPLE_BASE}（表示存入{constants.DEPOSIT_MULTIPLE_BASE}金币）"
+            f"📝 示例：存款 {base}（表示存入{base}金币）"
         )
     try:
         amount = int(parts[1])
@@ -52,19 +99,19 @@ def deposit(account,user_name,msg,path) -> str:
         return (
             f"{constants.ERROR_PREFIX}\n"
             f"金额不能为0或负数哦~ 请输入大于0的数值\n"
-            f"💡 建议：至少存入{constants.DEPOSIT_MULTIPLE_BASE}金币（如：存款 {constants.DEPOSIT_MULTIPLE_BASE}）。"
+            f"💡 建议：至少存入{base}金币（如：存款 {base}）。"
         )
-    if amount % constants.DEPOSIT_MULTIPLE_BASE != 0:
+    if amount % base != 0:
         return (
             f"{constants.ERROR_PREFIX}\n"
-            f"当前金额不符合要求呢~ 存款需为 {constants.DEPOSIT_MULTIPLE_BASE} 的整数倍\n"
+            f"当前金额不符合要求呢~ 存款需为 {base} 的整数倍\n"
             f"🔢 示例："
-            f"{constants.DEPOSIT_MULTIPLE_BASE}（1倍）、"
-            f"{constants.DEPOSIT_MULTIPLE_BASE * 2}（2倍）、"
-            f"{constants.DEPOSIT_MULTIPLE_BASE * 5}（5倍）等。"
+            f"{base}（1倍）、"
+            f"{base * 2}（2倍）、"
+            f"{base * 5}（5倍）等。"
         )
     try:
-        user_manager = IniFileReader(
+        user_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Briefly.info",
@@ -90,21 +137,9 @@ def deposit(account,user_name,msg,path) -> str:
             f"📝 差额提示：还差 {amount - user_gold} 个金币\n"
             f"💪 建议：先通过任务或交易赚取更多金币后再尝试哦~"
         )
-    # 业务逻辑：更新用户余额与银行存款
     new_gold = user_gold - amount
     try:
-        user_manager.update_key(section=account, key="coin", value=new_gold)
-        user_manager.save(encoding="utf-8")
-    except Exception as e:
-        logger.info(str(e))
-        return (
-            f"{constants.ERROR_PREFIX}\n"
-            f"个人账户更新失败~ \n"
-            f"⚠️ 错误原因：保存\n"
-            f"💡 请联系管理员核查个人账户数据~"
-        )
-    try:
-        bank_manager = IniFileReader(
+        bank_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Record",
             file_relative_path="Bank.data",
@@ -122,18 +157,21 @@ def deposit(account,user_name,msg,path) -> str:
 
     user_deposit = bank_data.get("deposit", 0)
     new_deposit = user_deposit + amount
+    # 业务逻辑：两个账户都读取成功后，再统一更新用户余额与银行存款（块内出错时不保存；两个文件依次保存，保存中途失败不会回滚已写入的文件）
     try:
-        bank_manager.update_key(section=account, key="deposit", value=new_deposit)
-        bank_manager.save(encoding="utf-8")
+        with transaction(user_manager, bank_manager):
+            user_manager.update_key(section=account, key="coin", value=new_gold)
+            bank_manager.update_key(section=account, key="deposit", value=new_deposit)
     except Exception as e:
         logger.info(str(e))
         return (
             f"{constants.ERROR_PREFIX}\n"
-            f"个人账户更新失败~ 银行账户已恢复\n"
+            f"个人账户更新失败~ \n"
             f"⚠️ 错误原因：保存\n"
             f"💡 请联系管理员核查个人账户数据~"
         )
 
+    current_time = datetime.now().strftime("%Y-%m-%d %H:%M")  # 仅在成功时读取当前时间
     success_msg = (
         f"{constants.SUCCESS_PREFIX}\n"
         f"🎉 {user_name} 先生/女士，您的操作已成功！\n"
@@ -154,46 +192,47 @@ def withdraw(account,user_name,msg,path) -> str:
     :param path:数据目录
     :return: 结果提示
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M")  # 获取当前时间
-
+    base = constants.DEPOSIT_MULTIPLE_BASE  # 金额基数（金额需为其整数倍）
     if not msg.startswith("取款 "):
         return (
             f"{constants.ERROR_PREFIX}\n"
-            f"取款格式应为：取款 [金额]（例：取款 {constants.DEPOSIT_MULTIPLE_BASE}）\n"
-            f"✨ 温馨提示：金额需为{constants.DEPOSIT_MULTIPLE_BASE}的整数倍，"
-            f"例如{constants.DEPOSIT_MULTIPLE_BASE}、{constants.DEPOSIT_MULTIPLE_BASE*5}等。"
+            f"取款格式应为：取款 [金额]（例：取款 {base}）\n"
+            f"✨ 温馨提示：金额需为{base}的整数倍，"
+            f"例如{base}、{base*5}等。"
         )
     parts = msg.split()
     if len(parts) < 2:
         return (
             f"{constants.ERROR_PREFIX}\n"
             f"信息不完整呢~ 请补充完整的取款金额\n"
-            f"📝 示例：取款 {constants.DEPOSIT_MULTIPLE_BASE}（表示从银行取出{constants.DEPOSIT_MULTIPLE_BASE}金币）"
+            f"📝 示例：取款 {base}（表示从银行取出{base}金币）"
         )
 
     try:
         amount = int(parts[1])
     except ValueError:
-        logger.error(f"取款错误金额{amount}")
-        amount = 1
+        return (
+            f"{constants.ERROR_PREFIX}\n"
+            f"金额格式错误~ 请输入有效的整数"
+        )
 
     if amount <= 0:
         return (
             f"{constants.ERROR_PREFIX}\n"
             f"金额不能为0或负数哦~ 请输入大于0的数值\n"
-            f"💡 建议：至少取出{constants.DEPOSIT_MULTIPLE_BASE}金币（如：取款 {constants.DEPOSIT_MULTIPLE_BASE}）。"
+            f"💡 建议：至少取出{base}金币（如：取款 {base}）。"
         )
-    if amount % constants.DEPOSIT_MULTIPLE_BASE != 0:
+    if amount % base != 0:
         return (
             f"{constants.ERROR_PREFIX}\n"
-            f"当前金额不符合要求呢~ 取款需为constants.DEPOSIT_MULTIPLE_BASE的整数倍\n"
-            f"🔢 示例：{constants.DEPOSIT_MULTIPLE_BASE}（1倍）、"
-            f"{constants.DEPOSIT_MULTIPLE_BASE*2}（2倍）、"
-            f"{constants.DEPOSIT_MULTIPLE_BASE*5}（5倍）等。"
+            f"当前金额不符合要求呢~ 取款需为 {base} 的整数倍\n"
+            f"🔢 示例：{base}（1倍）、"
+            f"{base*2}（2倍）、"
+            f"{base*5}（5倍）等。"
         )
     # ---------- 读取银行账户数据（含异常处理） ----------
     try:
-        bank_manager = IniFileReader(
+        bank_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Record",
             file_relative_path="Bank.data",
@@ -219,21 +258,9 @@ def withdraw(account,user_name,msg,path) -> str:
         )
     # ---------- 计算银行账户新余额（临时变量暂存，防事务失败） ----------
     new_deposit = bank_deposit - amount
-    # ---------- 更新银行账户（含异常处理） ----------
-    try:
-        bank_manager.update_key(section=account, key="deposit", value=new_deposit)
-        bank_manager.save(encoding="utf-8")
-    except Exception as e:
-        logger.info(str(e))
-        return (
-            f"{constants.ERROR_PREFIX}\n"
-            f"银行账户更新失败~ 资金未变动\n"
-            f"⚠️ 错误原因：保存\n"
-            f"💡 请联系管理员核查数据~"
-        )
     # ---------- 读取个人账户数据（含异常处理） ----------
     try:
-        user_manager = IniFileReader(
+        user_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Briefly.info",
@@ -244,26 +271,28 @@ def withdraw(account,user_name,msg,path) -> str:
         logger.info(str(e))
         return (
             f"{constants.ERROR_PREFIX}\n"
-            f"个人账户读取失败~ 银行账户已恢复\n"
+            f"个人账户读取失败~ 本次未写入任何数据\n"
             f"⚠️ 错误原因：读取\n"
             f"💡 请联系管理员核查个人账户数据~"
         )
     # 计算个人账户新余额
     user_gold = user_data.get("coin", 0)
     new_gold = user_gold + amount
-    # ---------- 更新个人账户（含异常处理） ----------
+    # ---------- 统一更新银行账户与个人账户（块内出错时不保存；两个文件依次保存，保存中途失败不会回滚已写入的文件） ----------
     try:
-        user_manager.update_key(section=account, key="coin", value=new_gold)
-        user_manager.save(encoding="utf-8")
+        with transaction(bank_manager, user_manager):
+            bank_manager.update_key(section=account, key="deposit", value=new_deposit)
+            user_manager.update_key(section=account, key="coin", value=new_gold)
     except Exception as e:
         logger.info(str(e))
         return (
             f"{constants.ERROR_PREFIX}\n"
-            f"个人账户更新失败~ 银行账户已恢复\n"
+            f"账户更新失败~ 数据可能未完整保存\n"
             f"⚠️ 错误原因：保存\n"
-            f"💡 请联系管理员核查个人账户数据~"
+            f"💡 请联系管理员核查数据~"
         )
 
+    current_time = datetime.now().strftime("%Y-%m-%d %H:%M")  # 仅在成功时读取当前时间
     success_msg = (
         f"{constants.SUCCESS_PREFIX}\n"
         f"🎉 {user_name} ，您的取款操作已成功！\n"
@@ -285,26 +314,27 @@ def loan(account,user_name,msg,path) -> str:
     :param path: 数据目录路径（用于定位 Bank.data 文件）
     :return: 操作结果提示信息
     """
+    base = constants.DEPOSIT_MULTIPLE_BASE  # 金额基数（金额需为其整数倍）
 
     if not msg.startswith("贷款 "):
-        return f"{user_name}，贷款格式，请使用：贷款 金额（例：贷款 {constants.DEPOSIT_MULTIPLE_BASE}）"
+        return f"{user_name}，贷款格式，请使用：贷款 金额（例：贷款 {base}）"
     parts = msg.split()
     if len(parts) < 2:
-        return f"{user_name}，格式不对哦~😢 正确姿势是：贷款 金额（例：贷款 {constants.DEPOSIT_MULTIPLE_BASE}）"
+        return f"{user_name}，格式不对哦~😢 正确姿势是：贷款 金额（例：贷款 {base}）"
     try:
         amount = int(parts[1])
     except ValueError:
         return (f"{user_name}，金额必须是整数哦~😢 正确姿势是："
-                f"贷款 {constants.DEPOSIT_MULTIPLE_BASE}/{constants.DEPOSIT_MULTIPLE_BASE*2}/..."
-                f"（例：贷款 {constants.DEPOSIT_MULTIPLE_BASE}）")
+                f"贷款 {base}/{base*2}/..."
+                f"（例：贷款 {base}）")
     if amount <= 0:
         return f"{user_name}，贷款0个金币可不行~😜 至少贷款1个吧！"
-    if amount % constants.DEPOSIT_MULTIPLE_BASE != 0:
-        return f"{user_name}，金额需为{constants.DEPOSIT_MULTIPLE_BASE}的整数倍（例：{constants.DEPOSIT_MULTIPLE_BASE*2}）"
+    if amount % base != 0:
+        return f"{user_name}，金额需为{base}的整数倍（例：{base*2}）"
 
     # ---------- 读取账户数据 ----------
     try:
-        bank_manager = IniFileReader(
+        bank_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Record",
             file_relative_path="Bank.data",
@@ -323,15 +353,10 @@ def loan(account,user_name,msg,path) -> str:
 
     # -------------------- 计算历史贷款利息 --------------------
     new_loan = current_loan  # 初始化为新贷款总额（后续累加利息和本次金额）
-    now_time = time.time()
+    now_time = int(time.time())  # 贷款时间戳按整秒存储
     if current_loan > 0 and bank_loan_time > 0:
-        # 计算时间差（秒）：当前时间戳 - 最后一次贷款时间戳
-        delta_seconds = Decimal(now_time) - Decimal(bank_loan_time)
-        # 计算利息（年利率 × 本金 × 时间差秒数 / 一年的总秒数）
-        # 公式：利息 = 本金 × (年利率 / 一年的总秒数) × 时间差秒数
-        interest = (Decimal(current_loan) * constants.LOAN_ANNUAL_INTEREST_RATE * delta_seconds) / constants.SECONDS_PER_YEAR
-        interest = interest.quantize(Decimal('1'), rounding=ROUND_HALF_UP)  # 四舍五入到整数
-        new_loan += interest  # 本金+利息作为新本金
+        # 计算利息（年利率 × 本金 × 时间差秒数 / 一年的总秒数），本金+利息作为新本金
+        new_loan += _loan_interest(current_loan, bank_loan_time, now_time)
     # -------------------- 更新账户数据 --------------------
     new_loan += amount
     new_deposit = bank_deposit + amount
@@ -368,20 +393,21 @@ def repayment(account,user_name,msg,path) -> str:
     :param path: 数据目录路径（定位 Bank.data 文件）
     :return: 操作结果提示信息
     """
+    base = constants.DEPOSIT_MULTIPLE_BASE  # 金额基数（金额需为其整数倍）
     # -------------------- 常量定义 --------------------
     if not msg.startswith("还款 "):
-        f"{constants.ERROR_PREFIX}\n还款格式请使用：还款 金额（例：还款 {constants.DEPOSIT_MULTIPLE_BASE}）"
+        return f"{constants.ERROR_PREFIX}\n还款格式请使用：还款 金额（例：还款 {base}）"
     parts = msg.split()
     if len(parts) < 2:
-        return f"{constants.ERROR_PREFIX}\n格式不对哦~😢 正确姿势是：还款 金额（例：还款 {constants.DEPOSIT_MULTIPLE_BASE}）"
+        return f"{constants.ERROR_PREFIX}\n格式不对哦~😢 正确姿势是：还款 金额（例：还款 {base}）"
     try:
         amount = int(parts[1])
     except ValueError:
-        return f"{constants.ERROR_PREFIX}\n金额必须是有效的整数（例：{constants.DEPOSIT_MULTIPLE_BASE}）"
+        return f"{constants.ERROR_PREFIX}\n金额必须是有效的整数（例：{base}）"
     if amount <= 0:
         return f"{constants.ERROR_PREFIX}\n还款金额不能少于0金币！"
     try:
-        user_manager = IniFileReader(
+        user_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Briefly.info",
@@ -394,7 +420,7 @@ def repayment(account,user_name,msg,path) -> str:
         return f"{constants.ERROR_PREFIX}\n读取用户账户信息失败，请稍后再试。"
 
     try:
-        bank_manager = IniFileReader(
+        bank_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Record",
             file_relative_path="Bank.data",
@@ -410,20 +436,9 @@ def repayment(account,user_name,msg,path) -> str:
         return f"{user_name}你未有贷款项目，无需还款！"
     # -------------------- 计算贷款利息（直接使用秒数，精确到极小时间差） --------------------
     loan_time = bank_data.get("loan_time", 0)
-    interest = Decimal('0')
     if loan_time > 0:
-        # 计算时间差（秒）：当前时间戳 - 最后贷款时间戳（精确到微秒）
-        now_time = time.time()  # 当前时间戳（浮点数，含微秒）
-        delta_seconds = Decimal(now_time) - Decimal(loan_time)  # 转换为 Decimal 保留精度
-
-        # 利息公式：本金 × 年利率 × 时间差（秒） / 一年的总秒数
-        # 公式推导：年利息 = 本金 × 年利率 → 日利息 = 年利息 / 365 → 秒利息 = 日利息 / 86400
-        # 等价于：秒利息 = 本金 × 年利率 × 秒差 / (365×86400) = 本金 × 年利率 × 秒差 / SECONDS_PER_YEAR
-        interest = (Decimal(bank_loan) * constants.LOAN_ANNUAL_INTEREST_RATE * delta_seconds) / constants.SECONDS_PER_YEAR
-
-        # 四舍五入到整数（金币最小单位为 1）
-        interest = interest.quantize(Decimal('1'), rounding=ROUND_HALF_UP)
-        bank_loan += interest
+        # 利息公式：本金 × 年利率 × 时间差（秒） / 一年的总秒数，四舍五入到整数（金币最小单位为 1）
+        bank_loan += _loan_interest(bank_loan, loan_time, time.time())
     # -------------------- 校验还款金额是否足够 --------------------
     if amount < bank_loan:
         return (
@@ -432,23 +447,18 @@ def repayment(account,user_name,msg,path) -> str:
             f"请至少还款{bank_loan}金币。"
         )
     new_gold = user_gold - amount
-    try:
-        user_manager.update_key(section=account, key="coin", value=new_gold)
-        user_manager.save(encoding="utf-8")
-    except Exception as e:
-        logger.info(str(e))
-        return f"{constants.ERROR_PREFIX}\n用户活期余额更新失败，资金未变动。"
-
     new_loan = bank_loan - amount
+    # 活期余额与贷款信息统一提交（块内出错时不保存；两个文件依次保存，保存中途失败不会回滚已写入的文件）
     try:
-        bank_manager.update_section_keys(section=account, data={
-            "loan": new_loan,
-            "loan_time": 0
-        })
-        bank_manager.save(encoding="utf-8")
+        with transaction(user_manager, bank_manager):
+            user_manager.update_key(section=account, key="coin", value=new_gold)
+            bank_manager.update_section_keys(section=account, data={
+                "loan": new_loan,
+                "loan_time": 0
+            })
     except Exception as e:
         logger.info(str(e))
-        return f"{constants.ERROR_PREFIX}\n银行贷款信息更新失败，资金未变动。"
+        return f"{constants.ERROR_PREFIX}\n还款信息更新失败，数据可能未完整保存，请联系管理员核查。"
 
     # -------------------- 返回结果（清晰透明） --------------------
     # 复利  年利息 = 本金 × 年利率→ 秒利息 = 年利息 / 一年总秒数→ 总利息 = 本金 × 年利率 × 时间差秒数 / 一年总秒数。
@@ -482,7 +492,7 @@ def fixed_deposit(account,user_name,msg,path) -> str:
         return f"{user_name}，存定期金额必须是{constants.FIXED_DEPOSIT_MULTIPLE_BASE}的整数倍哦~😢 "
     # -------------------- 读取账户数据（含异常处理） --------------------
     try:
-        bank_manager = IniFileReader(
+        bank_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Record",
             file_relative_path="Bank.data",
@@ -508,7 +518,7 @@ def fixed_deposit(account,user_name,msg,path) -> str:
         return f"{user_name}，活期存款不足（当前仅{current_deposit}金币），请先存款后再操作！"
     new_deposit = current_deposit - amount
     new_fixed_deposit = current_fixed_deposit + amount
-    new_fixed_deposit_date = datetime.now().strftime("%Y-%m-%d")
+    new_fixed_deposit_date = get_today_str()
     # -------------------- 执行存定期操作 --------------------
     try:
         bank_manager.update_section_keys(section=account, data={"deposit": new_deposit,
@@ -527,9 +537,7 @@ def fixed_deposit(account,user_name,msg,path) -> str:
         f"存入日期：{new_fixed_deposit_date}\n"
         f"当前活期余额：{new_deposit} 金币\n"
         f"当前定期总额：{new_fixed_deposit} 金币\n"
-        f"预计每日利息：{(Decimal(new_fixed_deposit) * Decimal(constants.FIXED_DEPOSIT_ANNUAL_INTEREST_RATE)
-            / Decimal('360') * Decimal("1")
-           ).quantize(Decimal('1'), rounding=ROUND_HALF_UP)} 金币"
+        f"预计每日利息：{_fixed_deposit_interest(new_fixed_deposit, 1)} 金币"
     )
 
 def redeem_fixed_deposit(account,user_name,path) -> str:
@@ -543,7 +551,7 @@ def redeem_fixed_deposit(account,user_name,path) -> str:
      """
     # -------------------- 读取账户数据（含类型校验） --------------------
     try:
-        bank_manager = IniFileReader(
+        bank_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Record",
             file_relative_path="Bank.data",
@@ -563,11 +571,9 @@ def redeem_fixed_deposit(account,user_name,path) -> str:
         return f"{user_name}，尚未有定期存款项目！"
     # 计算利息（连本带息）
     # 存期天数 = 当前时间 - 存入日期
-    now_date = datetime.now().strftime("%Y-%m-%d")
+    now_date = get_today_str()
     delta_days = calculate_delta_days(now_date, fixed_deposit_date)
-    interest = (Decimal(current_fixed_deposit) * Decimal(constants.FIXED_DEPOSIT_ANNUAL_INTEREST_RATE)
-            / Decimal('360') * Decimal(delta_days)
-           ).quantize(Decimal('1'), rounding=ROUND_HALF_UP)
+    interest = _fixed_deposit_interest(current_fixed_deposit, delta_days)
     new_deposit = current_deposit + current_fixed_deposit + interest
     try:
         bank_manager.update_section_keys(section=account, data={"deposit": new_deposit,
@@ -596,7 +602,7 @@ def check_deposit(account,user_name,path) -> str:
      :return: 操作结果提示信息
      """
     try:
-        bank_manager = IniFileReader(
+        bank_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Record",
             file_relative_path="Bank.data",
@@ -607,22 +613,12 @@ def check_deposit(account,user_name,path) -> str:
         logger.error(f"查询存款失败（账号：{account}）: {str(e)}")
         return f"{user_name}，系统繁忙，请稍后再试~😢"
     current_deposit = bank_data.get("deposit", 0)
-    current_loan = bank_data.get("loan", 0)
-    bank_loan_time = bank_data.get("loan_time", 0)
+    current_loan, bank_loan_time = bank_data.get("loan", 0), bank_data.get("loan_time", 0)
     current_fixed_deposit = bank_data.get("fixed_deposit", 0)
-    # 计算贷款
-    if current_loan > 0 and bank_loan_time > 0:
-        # 计算时间差（秒）：当前时间戳 - 最后贷款时间戳（精确到微秒）
-        now_time = time.time()  # 当前时间戳（浮点数，含微秒）
-        delta_seconds = Decimal(now_time) - Decimal(bank_loan_time)  # 转换为 Decimal 保留精度
-
-        # 利息公式：本金 × 年利率 × 时间差秒数 / 一年总秒数
-        interest = (Decimal(current_loan)
-                    * constants.LOAN_ANNUAL_INTEREST_RATE
-                    * delta_seconds
-                   ) / constants.SECONDS_PER_YEAR
-        interest = interest.quantize(Decimal('1'), rounding=ROUND_HALF_UP)  # 四舍五入到整数
-        current_loan += interest
+    # 计算贷款（无贷款用户直接跳过利息计算）
+    if current_loan and bank_loan_time:
+        # 利息公式：本金 × 年利率 × 时间差秒数 / 一年总秒数（四舍五入到整数）
+        current_loan += _loan_interest(current_loan, bank_loan_time, time.time())
 
     # -------------------- 优化提示信息 --------------------
     # 友好开头
@@ -645,13 +641,20 @@ def transfer(account,user_name,msg,path) -> str:
     if not msg.startswith("转账 "):
         return f"❌ 转账正确格式：转账 金额@对象（示例：转账 {constants.DEPOSIT_MULTIPLE_BASE}@小梦）"
     amount,target_qq=get_by_qq(msg)
+    # 金额与对象全部校验通过后才读取账户文件
+    try:
+        amount = int(amount)
+    except (TypeError, ValueError):
+        return f"❌ 转账金额必须是整数！正确格式：转账 金额@对象（示例：转账 {constants.DEPOSIT_MULTIPLE_BASE}@小梦）"
+    if amount <= 0:
+        return f"❌ 转账金额必须大于0！正确格式：转账 金额@对象（示例：转账 {constants.DEPOSIT_MULTIPLE_BASE}@小梦）"
     if amount % constants.DEPOSIT_MULTIPLE_BASE != 0:
-        return f"{user_name}，存定期金额必须是{constants.DEPOSIT_MULTIPLE_BASE}的整数倍哦~😢 "
+        return f"{user_name}，转账金额必须是{constants.DEPOSIT_MULTIPLE_BASE}的整数倍哦~😢 "
     if not target_qq:
-        return "请确认转账对象！正确格式：转账 金额@对象（示例：转账 {constants.DEPOSIT_MULTIPLE_BASE}@小梦）"
+        return f"请确认转账对象！正确格式：转账 金额@对象（示例：转账 {constants.DEPOSIT_MULTIPLE_BASE}@小梦）"
     # -------------------- 2. 初始化INI文件管理器（含异常处理） --------------------
     try:
-        bank_manager = IniFileReader(
+        bank_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Record",
             file_relative_path="Bank.data",
@@ -679,19 +682,22 @@ def transfer(account,user_name,msg,path) -> str:
     sender_new_deposit = sender_deposit - total_deduction
     receiver_new_deposit = receiver_deposit + amount
     try:
-        bank_manager.update_key(section=account, key="deposit", value=sender_new_deposit)
-        bank_manager.update_key(section=target_qq, key="deposit", value=receiver_new_deposit)
-        bank_manager.save(encoding="utf-8")
+        with transaction(bank_manager):
+            bank_manager.update_many({
+                account: {"deposit": sender_new_deposit},
+                target_qq: {"deposit": receiver_new_deposit},
+            })
     except Exception as e:
         logger.error(f"转账操作失败（发送者：{account}，接收者：{target_qq}）：{str(e)}")
         return f"❌ 系统错误：转账操作失败!"
     # -------------------- 7. 返回详细成功信息（用户友好） --------------------
-    return (
-        f"✅ 转账成功！\n"
-        f"发送者：{user_name}\n"
-        f"接收者：{target_qq}\n"
-        f"转账金额：{amount}\n"
-        f"手续费（{constants.TRANSFER_PROCESSING_FEE_RATE * 100}%）：{amount * constants.TRANSFER_PROCESSING_FEE_RATE}金币\n"
-        f"发送者原余额：{sender_deposit} → 新余额：{sender_new_deposit} 金币\n"
-        f"接收者原余额：{receiver_deposit} → 新余额：{receiver_new_deposit} 金币"
-    )
\ No newline at end of file
+    return _TRANSFER_OK.format_map({
+        "user_name": user_name,
+        "target_qq": target_qq,
+        "amount": amount,
+        "fee": amount * constants.TRANSFER_PROCESSING_FEE_RATE,
+        "sd": sender_deposit,
+        "snd": sender_new_deposit,
+        "rd": receiver_deposit,
+        "rnd": receiver_new_deposit,
+    })
\ No newline at end of file
@@ -3,18 +3,29 @@ import random
 import time
 from astrbot.api import logger
 
-from model import constants
-from model.data_managers import IniFileReader,FishFileHandler,ShopFileHandler,UnifiedCreelManager
-
-def fish_menu():
-    return (
-        "🌊 您现在在湖边钓鱼～\n"
-        "当前可选择操作：\n"
-        "▸ 钓鱼（试试今天的手气！）\n"
-        "▸ 提竿（看看钓到了什么～）\n"
-        "▸ 我的鱼篓（检查战利品）\n"
-        "▸ 钓鱼图鉴（了解鱼的信息）"
-    )
+from model.constants import FISH_TIME_START, FISH_TIME_END, FISH_TIME_INTERVAL, FISH_STAMINA
+from model.data_managers import FishFileHandler,ShopFileHandler,UnifiedCreelManager,get_ini_reader,get_json_handler,transaction
+
+_FISH_MENU_STR = (
+    "🌊 您现在在湖边钓鱼～\n"
+    "当前可选择操作：\n"
+    "▸ 钓鱼（试试今天的手气！）\n"
+    "▸ 提竿（看看钓到了什么～）\n"
+    "▸ 我的鱼篓（检查战利品）\n"
+    "▸ 钓鱼图鉴（了解鱼的信息）"
+)
+
+def fish_menu() -> str:
+    return _FISH_MENU_STR
+
+def roll_fish_weight(base_weight: float) -> float:
+    """
+    在基准重量 ±20% 范围内随机生成渔获重量，保留一位小数（如 2.3、5.6）
+    :param base_weight: 鱼的基准重量
+    :return: 最终重量
+    """
+    # 等价于 random.uniform(0.8*w, 1.2*w)，直接用一次 random() 抽样换算，省去 uniform 的额外运算
+    return round(base_weight * (0.8 + 0.4 * random.random()), 1)
 
 def cast_fishing_rod(account:str, user_name:str, path) -> str:
     """
@@ -27,7 +38,7 @@ def cast_fishing_rod(account:str, user_name:str, path) -> str:
     # -------------------- 步骤1：读取基础数据（钓鱼状态/商店配置） --------------------
     try:
         # 读取钓鱼记录文件（记录当前钓鱼状态）
-        fish_manager = IniFileReader(
+        fish_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Record",
             file_relative_path="Fish.data",
@@ -35,7 +46,8 @@ def cast_fishing_rod(account:str, user_name:str, path) -> str:
         )
         fish_data = fish_manager.read_section(section=account,create_if_not_exists=True)
         # 读取商店配置（获取鱼竿基础参数）
-        shop_manager = ShopFileHandler(
+        shop_manager = get_json_handler(
+            ShopFileHandler,
             project_root=path,
             subdir_name="City/Set_up",
             file_relative_path="Shop.res",
@@ -57,7 +69,7 @@ def cast_fishing_rod(account:str, user_name:str, path) -> str:
 
     # -------------------- 步骤3：读取购物篮数据（耐久/数量） --------------------
     try:
-        basket_manager = IniFileReader(
+        basket_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Basket.info",
@@ -78,29 +90,24 @@ def cast_fishing_rod(account:str, user_name:str, path) -> str:
         return f"{user_name} 当前鱼饵（{user_bait}）数量不足（剩余：{current_bait_amount}），请更换或购买新鱼饵！"
 
     # -------------------- 步骤4：生成钓鱼时间范围 --------------------
-    rod_data = shop_manager.get_item_info(user_rod)
+    rod_data = shop_manager.data.get(user_rod) or {}  # 鱼竿已下架时按无附加时间处理
     now_time = time.time()
     # 生成随机延迟范围（范围=基础+附加）
-    end_min = random.randint(a = constants.FISH_TIME_START,b = constants.FISH_TIME_END)
-    end_max = end_min + constants.FISH_TIME_INTERVAL + rod_data.get("time",0)
+    end_min = random.randint(a = FISH_TIME_START,b = FISH_TIME_END)
+    end_max = end_min + FISH_TIME_INTERVAL + rod_data.get("time",0)
+    # -------------------- 步骤5：更新钓鱼状态与购物篮数据（统一提交） --------------------
     try:
-        fish_manager.update_section_keys(section=account, data={
-            "is_fishing": True,
-            "start": now_time,
-            "end_min": now_time + end_min,
-            "end_max": now_time + end_max
-        })
-        fish_manager.save(encoding="utf-8")
+        with transaction(fish_manager, basket_manager):
+            fish_manager.update_section_keys(section=account, data={
+                "is_fishing": True,
+                "start": now_time,
+                "end_min": now_time + end_min,
+                "end_max": now_time + end_max
+            })
+            basket_manager.update_key(section=account, key=user_bait, value=current_bait_amount - 1)
     except Exception as e:
-        logger.error(f"保存错误：{str(e)}")
+        logger.error(f"保存钓鱼状态/扣减鱼饵失败：{str(e)}", exc_info=True)
         return "系统繁忙，请稍后重试！"
-    # -------------------- 步骤5：更新购物篮数据 --------------------
-    try:
-        basket_manager.update_key(section=account, key=user_bait, value=current_bait_amount - 1)
-        basket_manager.save(encoding="utf-8")
-    except Exception as e:
-        logger.error(f"扣减鱼饵数量失败：{str(e)}", exc_info=True)
-        return "系统繁忙，请稍后重试（鱼饵数量更新失败）"
     # -------------------- 步骤6：返回成功提示 --------------------
     return (
         f"{user_name} 抛竿成功！\n"
@@ -111,14 +118,14 @@ def cast_fishing_rod(account:str, user_name:str, path) -> str:
 
 def lift_rod(account:str, user_name:str, path:Path,fish_manager:FishFileHandler) -> str:
     try:
-        use_data_manager = IniFileReader(
+        use_data_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Briefly.info",
             encoding="utf-8",
         )
         user_stamina = use_data_manager.read_key(section=account, key="stamina", default=0)
-        user_fish_manager = IniFileReader(
+        user_fish_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Record",
             file_relative_path="Fish.data",
@@ -136,59 +143,55 @@ def lift_rod(account:str, user_name:str, path:Path,fish_manager:FishFileHandler)
     now_time = time.time()
 
     # 减少体力
-    if user_stamina < constants.FISH_STAMINA:
+    if user_stamina < FISH_STAMINA:
         return "体力不足，无法'提竿'"
 
+    # 体力扣减与钓鱼状态更新在块结束时统一提交（提竿过早/过晚同样扣除体力）
     try:
-        new_stamina = user_stamina - constants.FISH_STAMINA
-        use_data_manager.update_key(section=account, key="stamina", value=new_stamina)
-        use_data_manager.save(encoding="utf-8")
+        with transaction(use_data_manager, user_fish_manager):
+            new_stamina = user_stamina - FISH_STAMINA
+            use_data_manager.update_key(section=account, key="stamina", value=new_stamina)
+
+            start_time = user_fish_data.get("end_min", 0)  # 新增：假设存储了允许的最早开始时间（时间戳）
+            end_time = user_fish_data.get("end_max", 0)      # 新增：假设存储了允许的最晚结束时间（时间戳）
+            # 检查时间是否在有效区间：早到/晚到秒数各只算一次，判断与提示共用
+            early = start_time - now_time
+            if early > 0:
+                return f"{user_name} 你来得太早啦！当前时间还早 {int(early)} 秒，下次耐心等等~"
+            late = now_time - end_time
+            if late > 0:
+                return f"{user_name} 你来得太晚啦！钓鱼时间已结束 {int(late)} 秒前，下次早点来~"
+
+            user_bait = user_fish_data.get("current_bait")
+            random_fish = fish_manager.get_random_fish_by_bait(user_bait)
+            logger.info(random_fish)
+
+            if not random_fish:
+                return "没有找到匹配该鱼饵的鱼。"
+
+            # 提取鱼名和详细信息
+            fish_name = next(iter(random_fish.keys()))  # 获取鱼名（如 "鲫鱼"）
+            base_weight = random_fish[fish_name]["weight"]  # 获取鱼的重量信息
+
+            final_weight = roll_fish_weight(base_weight)
+
+            creel_manager = UnifiedCreelManager(
+                    save_dir=path,
+                    subdir="City/Record",
+                    data_filename="Creel.json"
+                )
+
+            creel_manager.add_fish_weight(
+                account=account,
+                fish_name=fish_name,
+                weight=final_weight,
+            )
+
+            user_fish_manager.update_key(section=account,key="is_fishing",value=False)
     except Exception as e:
         logger.error(f"保存数据错误：{str(e)}", exc_info=True)
         return "系统繁忙！请稍后重试"
 
-    start_time = user_fish_data.get("end_min", 0)  # 新增：假设存储了允许的最早开始时间（时间戳）
-    end_time = user_fish_data.get("end_max", 0)      # 新增：假设存储了允许的最晚结束时间（时间戳）
-    # 检查时间是否在有效区间（原逻辑保留，新增偏差计算）
-    if now_time < start_time:
-        delay_seconds = int(start_time - now_time)  # 计算早到秒数
-        return f"{user_name} 你来得太早啦！当前时间还早 {delay_seconds} 秒，下次耐心等等~"
-    elif now_time > end_time:
-        delay_seconds = int(now_time - end_time)    # 计算晚到秒数
-        return f"{user_name} 你来得太晚啦！钓鱼时间已结束 {delay_seconds} 秒前，下次早点来~"
-
-    user_bait = user_fish_data.get("current_bait")
-    random_fish = fish_manager.get_random_fish_by_bait(user_bait)
-    logger.info(random_fish)
-
-    if not random_fish:
-        return "没有找到匹配该鱼饵的鱼。"
-
-    # 提取鱼名和详细信息
-    fish_name = next(iter(random_fish.keys()))  # 获取鱼名（如 "鲫鱼"）
-    base_weight = random_fish[fish_name]["weight"]  # 获取鱼的重量信息
-
-    # 计算浮动范围（±20%）并生成随机重量（核心逻辑）
-    min_weight = base_weight * 0.8  # 最小重量：基准的 80%
-    max_weight = base_weight * 1.2  # 最大重量：基准的 120%
-    random_weight = random.uniform(min_weight, max_weight)  # 生成随机浮点数
-    final_weight = round(random_weight, 1)  # 保留一位小数（如 2.3kg、5.6kg）
-
-    creel_manager = UnifiedCreelManager(
-            save_dir=path,
-            subdir="City/Record",
-            data_filename="Creel.json"
-        )
-
-    creel_manager.add_fish_weight(
-        account=account,
-        fish_name=fish_name,
-        weight=final_weight,
-    )
-
-    user_fish_manager.update_key(section=account,key="is_fishing",value=False)
-    user_fish_manager.save(encoding="utf-8")
-
     return f"好耶！{user_name}钓到了{final_weight}斤重的{fish_name}让我们恭喜TA吧！"
 
 def my_creel(account:str, user_name:str, path) -> str:
@@ -213,8 +216,8 @@ def my_creel(account:str, user_name:str, path) -> str:
         # 用户不存在时返回提示
         return f"⚠️ {user_name}，查询失败：{str(e)}"
 
-    # 构建基础信息字符串
-    base_info = [
+    # 所有行收集到同一个列表，最后只 join 一次
+    lines = [
         f"🎣 {user_name} 的渔获概览",
         f"——————————",
         f"总捕获：{user_summary['total_catches']} 次",
@@ -224,16 +227,14 @@ def my_creel(account:str, user_name:str, path) -> str:
 
     # 处理无渔获记录的情况
     if user_summary["fish_types"] == 0:
-        base_info.append("当前还没有钓到任何鱼哦~ 快去钓鱼吧！")
-        return "\n".join(base_info)
+        lines.append("当前还没有钓到任何鱼哦~ 快去钓鱼吧！")
+        return "\n".join(lines)
 
     # 拼接各鱼种重量详情
-    fish_details = ["\n各鱼种重量统计："]
-    for fish_name, total in user_summary["fish_weights"].items():
-        fish_details.append(f"  • {fish_name}：{total} 斤")  # 同样假设单位是“斤”
+    lines.append("\n各鱼种重量统计：")
+    lines.extend(f"  • {fish_name}：{total} 斤" for fish_name, total in user_summary["fish_weights"].items())  # 同样假设单位是“斤”
 
-    # 合并所有信息并返回
-    return "\n".join(base_info + fish_details)
+    return "\n".join(lines)
 
 def fishing_encyclopedia(account:str, user_name:str, path) -> str:
     pass
\ No newline at end of file
@@ -1,7 +1,8 @@
 from ..data_managers import GameUpdateManager
-from model.data_managers import IniFileReader
+from model.data_managers import IniFileReader,get_ini_reader
 from model import constants
 from pathlib import Path
+from typing import Any, Dict, Tuple
 from astrbot.api import logger
 def update_notice(msg:str,game_manager:GameUpdateManager):
 
@@ -111,6 +112,23 @@ def history_event(msg: str, game_manager: GameUpdateManager):
     
     return result
 
+# Game.info 文件路径 -> (文件签名, 游戏ID->账号 反向索引)；文件未被外部修改时复用，绑定成功后就地更新
+_BOUND_ID_INDEX: Dict[Path, Tuple[Any, Dict[str, str]]] = {}
+
+def _get_bound_id_index(game_manager: IniFileReader) -> Dict[str, str]:
+    """获取已绑定游戏ID的反向索引（按文件签名缓存，文件被修改后才重新全量构建）"""
+    cached = _BOUND_ID_INDEX.get(game_manager.file_path)
+    if cached is not None and cached[0] == game_manager.signature:
+        return cached[1]
+    # 只读取各节的 game_id，无需解析整份文件；读取时数值会被解析为整数，统一转成字符串再比较
+    index = {
+        str(game_id): user_acc
+        for user_acc, game_id in game_manager.read_key_all("game_id").items()
+        if game_id != 0
+    }
+    _BOUND_ID_INDEX[game_manager.file_path] = (game_manager.signature, index)
+    return index
+
 def bind(account: str, user_name: str, msg: str, path:Path) ->str:
     """
     处理绑定《逃跑吧少年》手游账号的请求，支持格式校验、唯一性校验和详细异常提示。
@@ -132,13 +150,13 @@ def bind(account: str, user_name: str, msg: str, path:Path) ->str:
     if len(parts) < 2:
         return f"{constants.ERROR_PREFIX} 请提供有效游戏ID（如:游戏绑定 1234567）"
     game_id = parts[1].strip()
-    if not game_id.isdigit() or len(game_id) > 9:
+    if not 1 <= len(game_id) <= 9 or not game_id.isdigit():  # 先做廉价的长度判断，超长输入不再逐字符扫描
         return f"{constants.ERROR_PREFIX} 请提供有效游戏ID（如:游戏绑定 1234567）"
 
 
   # 步骤3：初始化游戏管理器
     try:
-        game_manager = IniFileReader(
+        game_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Game.info",
@@ -165,14 +183,13 @@ def bind(account: str, user_name: str, msg: str, path:Path) ->str:
 
     # 步骤5：检查游戏ID是否被其他用户绑定
     try:
-        all_user_data = game_manager.read_all()
-        for user_acc, user_data in all_user_data.items():
-            if user_acc == account:
-                continue
-            if user_data.get("game_id") == game_id:
-                return (
-                    f"{constants.ERROR_PREFIX} 绑定失败：游戏ID {game_id} 已被账号 {user_acc} 绑定！"
-                )
+        bound_index = _get_bound_id_index(game_manager)
+        bound_key = str(int(game_id))  # 与读取时的整数解析保持一致（忽略前导零）
+        user_acc = bound_index.get(bound_key)
+        if user_acc is not None and user_acc != account:
+            return (
+                f"{constants.ERROR_PREFIX} 绑定失败：游戏ID {game_id} 已被账号 {user_acc} 绑定！"
+            )
     except Exception as e:
         logger.error(f"查询游戏ID绑定状态失败（游戏ID[{game_id}]）: {str(e)}", exc_info=True)
         return f"{constants.ERROR_PREFIX} 查询绑定状态失败，请稍后重试！"
@@ -181,6 +198,8 @@ def bind(account: str, user_name: str, msg: str, path:Path) ->str:
     try:
         game_manager.update_key(section=account, key="game_id", value=game_id)
         game_manager.save()
+        bound_index[bound_key] = account
+        _BOUND_ID_INDEX[game_manager.file_path] = (game_manager.signature, bound_index)
         return f"{constants.SUCCESS_PREFIX} 您的游戏ID已绑定为：{game_id}"
     except Exception as e:
         logger.error(f"保存绑定数据失败（用户[{account}]，游戏ID[{game_id}]）: {str(e)}", exc_info=True)
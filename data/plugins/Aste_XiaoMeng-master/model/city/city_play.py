@@ -1,6 +1,14 @@
 import random
 from model.data_managers import IniFileReader
 
+_VALID_CHOICES = ("石头", "剪刀", "布")  # random.choice 需要序列，用元组
+# 用户获胜的情况：用户出拳 -> 被克制的出拳
+_WINNING_COMBINATIONS = {
+    "石头": "剪刀",
+    "剪刀": "布",
+    "布": "石头"
+}
+
 def rock(msg:str):
     """
     猜拳游戏函数
@@ -16,12 +24,11 @@ def rock(msg:str):
     user_choice = msg[3:].strip()  # 去掉"猜拳 "并去除前后空格
 
     # 检查用户选择是否有效
-    valid_choices = ["石头", "剪刀", "布"]
-    if user_choice not in valid_choices:
+    if user_choice not in _VALID_CHOICES:
         return "猜拳格式：猜拳 石头/剪刀/布"
     
     # 电脑随机选择
-    computer_choice = random.choice(valid_choices)
+    computer_choice = random.choice(_VALID_CHOICES)
 
     # 判断输赢
     result = determine_winner(user_choice, computer_choice)
@@ -43,13 +50,7 @@ def determine_winner(user_choice, computer_choice):
         return "平局！"
     
     # 用户获胜的情况
-    winning_combinations = {
-        "石头": "剪刀",
-        "剪刀": "布",
-        "布": "石头"
-    }
-    
-    if winning_combinations[user_choice] == computer_choice:
+    if _WINNING_COMBINATIONS[user_choice] == computer_choice:
         return "你赢了！"
     
     # 剩下的情况都是电脑赢
@@ -1,15 +1,35 @@
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 import uuid
 from astrbot.api import logger
 import asyncio
 from PIL import Image, ImageDraw, ImageFont
 
-from model.data_managers import IniFileReader
+from model.data_managers import IniFileReader,get_ini_reader
 from model.city_func import get_qq_nickname,get_system_font
 
 
+# ------------------------------ 排名缓存 ------------------------------
+# (文件路径, 排序字段) -> (文件签名, 是否有用户, 降序排名列表, 账号->名次映射)；Briefly.info 未变化时直接复用
+_RANK_CACHE: Dict[Tuple[Path, str], tuple] = {}
+
+def _get_ranking(user_handler: IniFileReader, sort_key: str) -> Tuple[bool, List[Tuple[str, Any]], Dict[str, int]]:
+    """按 sort_key 降序排名（结果按文件签名缓存，文件被修改后才重新排序）"""
+    cache_key = (user_handler.file_path, sort_key)
+    cached = _RANK_CACHE.get(cache_key)
+    if cached is not None and cached[0] == user_handler.signature:
+        return cached[1:]
+
+    user_data = user_handler.read_all() or {}
+    # 过滤有效用户并按数值降序排序
+    valid_users = [(acc, info.get(sort_key, 0)) for acc, info in user_data.items() if info.get(sort_key) is not None]
+    sorted_users = sorted(valid_users, key=lambda x: x[1], reverse=True)
+    rank_mapping = {acc: idx+1 for idx, (acc, _) in enumerate(sorted_users)}  # 排名映射
+    _RANK_CACHE[cache_key] = (user_handler.signature, bool(user_data), sorted_users, rank_mapping)
+    return bool(user_data), sorted_users, rank_mapping
+
+
 # ------------------------------ 核心排行榜函数 ------------------------------
 async def generate_rank(
     account: str,
@@ -21,32 +41,29 @@ async def generate_rank(
     """图文版排行榜（含用户当前排名、前三名颜色区分）"""
     try:
         # -------------------- 数据读取 --------------------
-        user_handler = IniFileReader(
+        user_handler = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Briefly.info",
             encoding="utf-8"
         )
-        user_data = user_handler.read_all() or {}
+        has_users, sorted_users, rank_mapping = _get_ranking(user_handler, sort_key)
     except Exception as e:
         logger.error(f"读取用户数据失败：{str(e)}")
         error_path = await _save_error_image("读取数据失败", get_system_font(24))
         return error_path
 
-    if not user_data:
+    if not has_users:
         error_path = await _save_error_image("无用户数据", get_system_font(24))
         return error_path
 
     # -------------------- 数据预处理 --------------------
-    # 过滤有效用户并按数值降序排序
-    valid_users = [(acc, info.get(sort_key, 0)) for acc, info in user_data.items() if info.get(sort_key) is not None]
-    if not valid_users:
+    if not sorted_users:
         error_path = await _save_error_image(f"无{title}数据", get_system_font(24))
         return error_path
 
-    sorted_users = sorted(valid_users, key=lambda x: x[1], reverse=True)
     top_n = min(10, len(sorted_users))  # 最多显示前10名
-    rank_mapping = {acc: idx+1 for idx, (acc, _) in enumerate(sorted_users)}  # 排名映射
+    user_rank = rank_mapping.get(account, 0)  # 当前用户排名（0 表示未上榜，O(1) 查询）
 
     # -------------------- 异步获取昵称（最多前10名） --------------------
     target_accounts = [u[0] for u in sorted_users[:top_n]]
@@ -76,7 +93,8 @@ async def generate_rank(
     item_h = int(item_bbox[3] - item_bbox[1]) + line_spacing  # 单个列表项高度
 
     # 用户信息区域高度（固定或动态）
-    user_info_h = int(item_font.size * 1.8) + 2 * padding  # 用户信息行高（加粗字体）
+    # 用户未上榜时不绘制用户信息区域，也不为其预留画布高度
+    user_info_h = int(item_font.size * 1.8) + 2 * padding if user_rank > 0 else 0  # 用户信息行高（加粗字体）
 
     # 总高度计算（标题+列表+用户信息+页脚）
     list_total_h = item_h * top_n
@@ -205,7 +223,6 @@ async def generate_rank(
         )
 
     # -------------------- 绘制用户当前排名信息（底部突出显示） --------------------
-    user_rank = rank_mapping.get(account, 0)  # 获取用户当前排名
     if user_rank > 0:  # 仅当用户有排名时显示
         # 用户信息背景色（浅金色/浅蓝色，突出显示）
         user_info_bg_color = "#FFF3CD" if user_rank <= 3 else "#E3F2FD"
@@ -221,7 +238,8 @@ async def generate_rank(
         # 用户信息文本（加粗，左对齐）
         user_info_font = ImageFont.truetype("simhei.ttf", user_info_font_size)
         user_nick = user_name if len(user_name) <= 15 else f"{user_name[:12]}..."  # 昵称截断
-        value_display = int(value) if isinstance(value, (int, float)) else "N/A"
+        user_value = sorted_users[user_rank - 1][1]  # 名次即在降序列表中的位置，O(1) 取当前用户数值
+        value_display = int(user_value) if isinstance(user_value, (int, float)) else "N/A"
         user_info_text = (
             f"当前第{user_rank}名 · {user_nick} · {value_display} {title}"
         )
@@ -1,25 +1,33 @@
 from astrbot.api import logger
 
 from model import constants
-from model.data_managers import IniFileReader
+from model.data_managers import get_ini_reader,transaction
 from model.city_func import get_by_qq,get_dynamic_rob_ratio
 
 import time
-import random
-from datetime import datetime
+from random import randint, random, choice
+from datetime import date
+
+_ROB_MENU_STR = (
+    "打劫专区 ️\n"
+    "—— 想当劫匪？先看清规则 ——\n"
+    "1.发起打劫[@目标]（入狱不可用）\n"
+    "👉 示例「打劫 @小明」\n"
+    "2.尝试越狱[体力 / 金币]\n"
+    "👉 示例「越狱」→ 搞点装备再跑\n"
+    "3.申请保释[@目标]（入狱后解锁）\n"
+    "👉 示例「保释 @对象」\n"
+    "4.发送出狱（自由状态自动恢复）\n"
+    "👉 示例「出狱」→ 重新获得自由\n"
+    " 输入上方指令，开始劫匪之旅 "
+)
+
+# 成功率在模块加载时换算为概率，判定时只需一次 random() 浮点抽样
+_ROB_P = constants.ROB_SUCCESS_RATE / 100.0
+_BREAK_P = constants.PRISON_BREAK_SUCCESS_RATE / 100.0
 
 def rob_menu() -> str:
-    return ("f打劫专区 ️\n"
-        f"—— 想当劫匪？先看清规则 ——\n"
-        f"1.发起打劫[@目标]（入狱不可用）\n"
-        f"👉 示例「打劫 @小明」\n"
-        f"2.尝试越狱[体力 / 金币]\n"
-        f"👉 示例「越狱」→ 搞点装备再跑\n"
-        f"3.申请保释[@目标]（入狱后解锁）\n"
-        f"👉 示例「保释 @对象」\n"
-        f"4.发送出狱（自由状态自动恢复）\n"
-        f"👉 示例「出狱」→ 重新获得自由\n"
-        f" 输入上方指令，开始劫匪之旅 ")
+    return _ROB_MENU_STR
 
 def rob(account:str, user_name:str, msg:str, path) -> str:
     exp,victim_qq =  get_by_qq(msg)
@@ -27,10 +35,10 @@ def rob(account:str, user_name:str, msg:str, path) -> str:
         return "打劫格式请使用：打劫 @对象"
 
     try:
-        user_manager = IniFileReader(
+        user_manager = get_ini_reader(
             project_root=path, subdir_name="City/Personal", file_relative_path="Briefly.info", encoding="utf-8"
         )
-        rob_manager = IniFileReader(
+        rob_manager = get_ini_reader(
             project_root=path, subdir_name="City/Record", file_relative_path="Rob.data", encoding="utf-8"
         )
         # 读取受害者与抢劫者的数据
@@ -43,7 +51,7 @@ def rob(account:str, user_name:str, msg:str, path) -> str:
 
     # ---- 新增：检查是否在狱中 ----
     jail_start_time = robber_rob_data.get("jail_time", 0)  # 默认0表示未入狱
-    current_time = time.time()
+    current_time = int(time.time())  # 入狱时间戳按整秒存储
     if jail_start_time > 0:
         # 计算剩余服刑时间（秒）
         remaining_seconds = max(0, constants.JAIL_TIME - int(current_time - jail_start_time))
@@ -62,61 +70,55 @@ def rob(account:str, user_name:str, msg:str, path) -> str:
         return f"{user_name} TA现在身无分文，打劫无意义！"
     current_robber_gold = robber_data.get("coin", 0)
 
-    # 打劫次数控制（每日重置）
-    today = datetime.today().isoformat()
+    # 打劫次数控制（每日重置，日期以序数整数存储；旧版字符串日期视为非今日）
+    today = date.today().toordinal()
     rob_count_today = robber_rob_data.get("rob_count_today", 0)
-    last_rob_date = robber_rob_data.get("last_rob_date", "")
+    last_rob_date = robber_rob_data.get("last_rob_date", 0)
 
     if last_rob_date != today:
-        rob_count_today = 0
-        rob_manager.update_section_keys(
-            section=account, data={"last_rob_date": today, "rob_count_today": 0}
-        )
+        rob_count_today = 0  # 跨日重置，与本次打劫次数一并写入
     # 减少打劫者体力
     new_robber_stamina = current_robber_stamina - constants.ROB_STAMINA
-    user_manager.update_key(section=account, key="stamina", value=new_robber_stamina)
 
     # ---- 动态计算可抢金额 ----
     dynamic_ratio = get_dynamic_rob_ratio(current_victim_gold)
     max_rob = max(1, int(current_victim_gold * dynamic_ratio))
-    rob_amount = random.randint(1, max_rob)
+    rob_amount = randint(1, max_rob)
 
-    # ---- 判断打劫结果 ----
-    is_success = random.randint(1, 100) <= constants.ROB_SUCCESS_RATE
+    # ---- 判断打劫结果（此处只计算，所有写入在下方事务内统一完成） ----
+    is_success = random() < _ROB_P
+    jail = False
 
     if is_success:
         # 抢劫成功 ✅
         new_victim_gold = max(0, current_victim_gold - rob_amount)
         new_robber_gold = current_robber_gold + rob_amount
-
-        # 更新数据
-        user_manager.update_key(section=victim_qq, key="coin", value=new_victim_gold)
-        user_manager.update_key(section=account, key="coin", value=new_robber_gold)
-
-        result_text = random.choice(constants.ROB_SUCCESS_EVENTS)(user_name,victim_qq,rob_amount)["text"]
+        result_text = choice(constants.ROB_SUCCESS_EVENTS)(user_name,victim_qq,rob_amount)["text"]
     else:
         # ❌ 失败逻辑
-        event = random.choice(constants.ROB_FAILURE_EVENTS)
+        event = choice(constants.ROB_FAILURE_EVENTS)
         coin_change = event["coin_change"]
         jail = event["jail"]
 
         new_robber_gold = max(0, current_robber_gold + coin_change)
-        # 更新用户数据（仅robber）
-        user_manager.update_key(section=account, key="coin", value=new_robber_gold)
         result_text = event["text"]
         if jail:
             result_text += f"{user_name} 你因打劫被关进监狱，剩余入狱秒数：{constants.JAIL_TIME} 秒！"
-            rob_manager.update_key(section=account,key="jail_time",value=time.time())
 
-    # ---- 公共逻辑：更新打劫次数&日期 & 保存数据 ----
+    # ---- 公共逻辑：体力/金币/入狱状态/打劫次数&日期 统一提交 ----
     rob_count_today += 1
-    rob_manager.update_section_keys(
-        section=account,
-        data={"rob_count_today": rob_count_today, "last_rob_date": today}
-    )
+    robber_record = {"rob_count_today": rob_count_today, "last_rob_date": today}
+    if jail:
+        robber_record["jail_time"] = current_time
     try:
-        user_manager.save(encoding="utf-8")
-        rob_manager.save(encoding="utf-8")
+        with transaction(user_manager, rob_manager):
+            if is_success:
+                user_manager.update_key(section=victim_qq, key="coin", value=new_victim_gold)
+            user_manager.update_section_keys(
+                section=account,
+                data={"stamina": new_robber_stamina, "coin": new_robber_gold}
+            )
+            rob_manager.update_section_keys(section=account, data=robber_record)
     except Exception as e:
         logger.error(f"保存数据失败: {e}")
         return "保存数据时出错，请稍后再试！"
@@ -126,7 +128,7 @@ def rob(account:str, user_name:str, msg:str, path) -> str:
 def released(account:str, user_name:str, path) -> str:
     """手动释放用户（出狱）"""
     try:
-        rob_manager = IniFileReader(
+        rob_manager = get_ini_reader(
             project_root=path, subdir_name="City/Record", file_relative_path="Rob.data", encoding="utf-8"
         )
     except Exception as e:
@@ -137,11 +139,13 @@ def released(account:str, user_name:str, path) -> str:
     if current_jail_time <= 0:
         return f"{user_name} 你未入狱，无需出狱！"
     # 正确判断：入狱开始时间 + 刑期 > 当前时间 → 未服完刑
-    if current_jail_time + constants.JAIL_TIME > time.time():
-        remaining = int(current_jail_time + constants.JAIL_TIME - time.time())
+    now = time.time()
+    end_time = current_jail_time + constants.JAIL_TIME
+    if end_time > now:
+        remaining = int(end_time - now)
         return f"{user_name} 未到出狱时间，还需服刑 {remaining} 秒！"
     try:
-        user_manager = IniFileReader(
+        user_manager = get_ini_reader(
             project_root=path, subdir_name="City/Personal", file_relative_path="Briefly.info", encoding="utf-8"
         )
     except Exception as e:
@@ -152,11 +156,10 @@ def released(account:str, user_name:str, path) -> str:
     if user_stamina < constants.RELEASED_STAMINA:
         return f"{user_name} 体力不足，休息一会再出狱吧！"
     new_stamina = user_stamina - constants.RELEASED_STAMINA
-    user_manager.update_key(section=account, key="stamina", value=new_stamina)
-    user_manager.save(encoding="utf-8")
-    # 清除入狱时间（设置为0表示未入狱）
-    rob_manager.update_key(section=account, key="jail_time", value=0)
-    rob_manager.save(encoding="utf-8")
+    with transaction(user_manager, rob_manager):
+        user_manager.update_key(section=account, key="stamina", value=new_stamina)
+        # 清除入狱时间（设置为0表示未入狱）
+        rob_manager.update_key(section=account, key="jail_time", value=0)
     # 可选：同步其他状态（如体力、金币）
     return f"用户 {user_name} 已成功出狱！"
 
@@ -172,7 +175,7 @@ def post_bail(account:str, user_name:str,msg:str, path):
         return f"{user_name} 你不能自己保释自己哦！"
     # 读取入狱记录（带异常处理）
     try:
-        rob_manager = IniFileReader(
+        rob_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Record",
             file_relative_path="Rob.data",
@@ -187,7 +190,7 @@ def post_bail(account:str, user_name:str,msg:str, path):
     if rob_time == 0:
         return f"{user_name} 他没有在监狱中哦！"
 
-    user_manager = IniFileReader(
+    user_manager = get_ini_reader(
         project_root=path,
         subdir_name="City/Personal",
         file_relative_path="Briefly.info",
@@ -197,10 +200,10 @@ def post_bail(account:str, user_name:str,msg:str, path):
     if user_gold < constants.BAIL_FEE:
         return f"{user_name} 保释需要 {constants.BAIL_FEE} 金币，你的金币不足！"
     new_gold = user_gold - constants.BAIL_FEE
-    user_manager.update_key(section=account, key="coin", value=new_gold)
-    user_manager.save(encoding="utf-8")
-    rob_manager.update_key(section=account, key="jail_time", value=0)
-    rob_manager.save(encoding="utf-8")
+    with transaction(user_manager, rob_manager):
+        user_manager.update_key(section=account, key="coin", value=new_gold)
+        # 被保释的是目标用户，清除其入狱时间
+        rob_manager.update_key(section=target_qq, key="jail_time", value=0)
     return f"{user_name} 保释成功！你支付了 {constants.BAIL_FEE} 金币～"
 
 def prison_break(account:str, user_name:str, path):
@@ -220,7 +223,7 @@ def prison_break(account:str, user_name:str, path):
         操作结果提示（成功/失败/错误信息）
     """
     try:
-        rob_manager = IniFileReader(
+        rob_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Record",
             file_relative_path="Rob.data",
@@ -234,7 +237,7 @@ def prison_break(account:str, user_name:str, path):
     if rob_time == 0:
         return f"{user_name} 当前你未在监狱里面！无需越狱！"
     try:
-        user_manager = IniFileReader(
+        user_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Briefly.info",
@@ -248,9 +251,12 @@ def prison_break(account:str, user_name:str, path):
     if user_stamina < constants.PRISON_BREAK_STAMINA:
         return f"{user_name} 体力不足，无法越狱！"
     new_stamina = user_stamina - constants.PRISON_BREAK_STAMINA
-    user_manager.update_key(section=account, key="stamina", value=new_stamina)
-    user_manager.save(encoding="utf-8")
-    if random.randint(a = 1,b = 100) <= constants.PRISON_BREAK_SUCCESS_RATE:
-        rob_manager.update_key(section=account, key="jail_time", value=0)
+    escaped = random() < _BREAK_P
+    # 体力扣除与出狱状态一并提交；越狱失败时 rob_manager 无修改，save 为空操作
+    with transaction(user_manager, rob_manager):
+        user_manager.update_key(section=account, key="stamina", value=new_stamina)
+        if escaped:
+            rob_manager.update_key(section=account, key="jail_time", value=0)
+    if escaped:
         return f"{user_name} 越狱成功！"
     return f"{user_name} 越狱失败！"
\ No newline at end of file
@@ -2,29 +2,70 @@ from typing import List
 from astrbot.api import logger
 
 from model import constants
-from model.data_managers import IniFileReader,ShopFileHandler
+from model.data_managers import IniFileReader,ShopFileHandler,get_ini_reader,get_json_handler,transaction
 from model.city_func import get_by_qq
 
+# 需要放入背包的商品类别
+_BASKET_CATS = frozenset({"exp", "stamina", "gift", "fishing_rod", "fishing_bait"})
+# 可在背包中叠加数量的商品类别
+_STACKABLE_CATS = frozenset({"exp", "stamina", "gift", "fishing_bait"})
+# 属性类道具：类别 -> (用户属性键, 商品属性键)
+_STAT_DISPATCH = {
+    "gift": ("charm", "charm_value"),
+    "exp": ("exp", "exp_value"),
+    "stamina": ("stamina", "recover_value"),
+}
+
+# 商品类型映射：类别 -> (类型名称, 关联字段列表)（支持扩展新商品类型，如后续新增"装备"类）
+_CATEGORY_MAPPING = {
+    "fishing_rod": ("鱼竿", ["strength", "time"]),
+    "gift": ("礼物", ["charm_value"]),
+    "exp": ("经验类", ["exp_value"]),
+    "stamina": ("体力类", ["recover_value"]),
+    "fishing_bait": ("鱼饵", ["strength"]),
+    "game": ("游戏", []),
+}
+# 商品字段别名映射（避免硬编码字段名）
+_FIELD_ALIAS = {
+    "charm_value": "✨ 魅力值",
+    "exp_value": "✨ 经验值",
+    "recover_value": "✨ 体力值",
+    "strength": "🎣 钓力",
+    "time": "⏱️ 时间窗",
+}
+
+# 商店类别查询：中文类别名 -> 类别键
+_SHOP_CATEGORY_KEYS = {
+    "游戏": "game",
+    "礼物": "gift",
+    "经验": "exp",
+    "体力": "stamina",
+    "鱼竿": "fishing_rod",
+    "鱼饵": "fishing_bait"
+}
+
+_SHOP_MENU_STR = (
+    "✦ ✦ 🏪 商 店 菜 单 ✨ ✦ ✦"
+    "\n————————————"
+    "\n🏬 商店：浏览所有上架商品"
+    "\n🔍 查商品：查看具体的信息"
+    "\n💰 购买：选择商品直接下单"
+    "\n🎒 背包：查看已购买的物品"
+    "\n🛠️ 使用：使用背包里的道具"
+)
+
 def shop_menu():
-    return (
-        f"✦ ✦ 🏪 商 店 菜 单 ✨ ✦ ✦"
-        f"\n————————————"
-        f"\n🏬 商店：浏览所有上架商品"
-        f"\n🔍 查商品：查看具体的信息"
-        f"\n💰 购买：选择商品直接下单"
-        f"\n🎒 背包：查看已购买的物品"
-        f"\n🛠️ 使用：使用背包里的道具"
-    )
+    return _SHOP_MENU_STR
 
-def shop(msg, path) -> str:
+def _format_price(price: int) -> str:
+    """格式化价格：>10000 显示为 X.XXk 格式（保留两位小数）"""
+    if price > 1000:
+        k_value = price / 1000  # 转换为千单位
+        return f"{k_value:.2f}k"  # 保留两位小数（自动四舍五入，末尾补零）
+    else:
+        return str(price)  # 普通价格直接显示
 
-    def format_price(price: int) -> str:
-        """格式化价格：>10000 显示为 X.XXk 格式（保留两位小数）"""
-        if price > 1000:
-            k_value = price / 1000  # 转换为千单位
-            return f"{k_value:.2f}k"  # 保留两位小数（自动四舍五入，末尾补零）
-        else:
-            return str(price)  # 普通价格直接显示
+def shop(msg, path) -> str:
     """
     处理商店查询命令，返回格式化字符串结果（取消商品详情模式）
 
@@ -37,7 +78,8 @@ def shop(msg, path) -> str:
     if not msg_clean.startswith("商店"):
         return "❌ 无效命令：请以'商店'开头"
 
-    shop_handler = ShopFileHandler(
+    shop_handler = get_json_handler(
+        ShopFileHandler,
         project_root=path,
         subdir_name="City/Set_up",
         file_relative_path="Shop.res",
@@ -77,12 +119,12 @@ def shop(msg, path) -> str:
         # 计算分页数据
         start = (page - 1) *  constants.SHOP_ITEMS_PER_PAGE
         end = start +  constants.SHOP_ITEMS_PER_PAGE
-        page_items = list(shop_handler.data.items())[start:end]
+        page_items = shop_handler.items_view()[start:end]
 
         # 格式化商品列表
         item_list = "\n".join(
-            [f"{i + 1}. {name} - {format_price(info['price'])} 金币(余:{info['quantity']})"
-             for i, (name, info) in enumerate(page_items)]
+            f"{i + 1}. {name} - {_format_price(info['price'])} 金币(余:{info['quantity']})"
+            for i, (name, info) in enumerate(page_items)
         )
         return (
             f"📖 小梦商店 第{page}/{total_pages}页\n"
@@ -92,36 +134,23 @@ def shop(msg, path) -> str:
 
     # ====================== 模式三：类别查询 ======================
 
-    category_mapping = {
-        "游戏": "game",
-        "礼物": "gift",
-        "经验": "exp",
-        "体力": "stamina",
-        "鱼竿": "fishing_rod",
-        "鱼饵": "fishing_bait"
-    }
-
     # 尝试匹配中文或英文类别
-    if param in category_mapping:
-        category_key = category_mapping[param]
+    if param in _SHOP_CATEGORY_KEYS:
+        category_key = _SHOP_CATEGORY_KEYS[param]
         display_name = param  # 使用中文作为显示名称
     else:
         return f"ℹ️ 未知类别：{param}"
 
-    # 获取对应类别商品并按价格排序
-    category_items = sorted(
-        [(name, info) for name, info in shop_handler.data.items()
-         if info["category"] == category_key],
-        key=lambda x: x[1]['price']
-    )
+    # 获取对应类别商品（已按价格排序，同价保持原顺序；商店数据变化前复用）
+    category_items = shop_handler.get_category_sorted(category_key)
 
     if not category_items:
         return f"ℹ️ {display_name}类别下暂无商品"
 
     # 构建商品列表
     item_list = "\n".join(
-        [f"{i + 1}. {name} - {format_price(info['price'])} 金币(余:{info['quantity']})"
-         for i, (name, info) in enumerate(category_items)]
+        f"{i + 1}. {name} - {_format_price(info['price'])} 金币(余:{info['quantity']})"
+        for i, (name, info) in enumerate(category_items)
     )
 
     return (
@@ -136,16 +165,18 @@ def purchase(account,user_name,msg,path) -> str:
     """
     购买功能
     """
-    if not msg.startswith("购买 "):
+    rest = msg.removeprefix("购买 ")  # 前缀匹配与截取一次完成
+    if len(rest) == len(msg):
         return "想要购买什么呢？发送[商店]查看心仪的商品吧！\n购买格式示例：购买 小心心"
 
-    goods_name = msg[3:].strip()
+    goods_name = rest.strip()
     if not goods_name:
         return "请输入要购买的商品名称！\n购买格式示例：购买 小心心"
 
     # -------------------- 初始化商店处理器 --------------------
     try:
-        shop_handler = ShopFileHandler(
+        shop_handler = get_json_handler(
+            ShopFileHandler,
             project_root=path,
             subdir_name="City/Set_up",
             file_relative_path="Shop.res",
@@ -157,15 +188,15 @@ def purchase(account,user_name,msg,path) -> str:
 
     # -------------------- 商品基础校验 --------------------
     # 校验商品存在性及可用状态
-    if goods_name not in shop_handler.data:
+    goods_data = shop_handler.data.get(goods_name)
+    if goods_data is None:
         similar_goods = shop_handler.get_similar_items(item_name=goods_name,similarity_threshold=0.5,top_n_name=3)
         hint = f"未找到商品「{goods_name}」"
         if similar_goods:
-            hint += f"，猜你想要：{'、'.join(similar_goods[0])}？"
+            hint += f"，猜你想要：{'、'.join(name for name, _ in similar_goods)}？"
         hint += "\n发送[商店]查看所有商品"
         return hint
 
-    goods_data = shop_handler.data[goods_name]
     goods_category = goods_data.get("category")
     goods_price = goods_data.get("price", 0)
     goods_quantity = goods_data.get("quantity",0)
@@ -181,7 +212,7 @@ def purchase(account,user_name,msg,path) -> str:
         return f"该商品{goods_name}已售完，请留意商店公告！"
     # -------------------- 读取用户数据 --------------------
     try:
-        user_manager = IniFileReader(
+        user_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Briefly.info",
@@ -195,30 +226,20 @@ def purchase(account,user_name,msg,path) -> str:
     if user_gold < goods_price:
         return f"金币不足（当前{user_gold}，需要{goods_price}），无法购买「{goods_name}」"
 
-    # -------------------- 事务准备 --------------------
-    files_to_save: List[tuple[str, IniFileReader]] = [
-        ("Briefly.res", user_manager),  # 用户金币数据
-        ("Shop.res", shop_handler)  # 商店库存数据
-    ]
-
-    if goods_category in ("exp", "stamina","gift","fishing_rod", "fishing_bait"):
-        basket_manager = IniFileReader(
+    # -------------------- 附加校验（需读取背包/游戏数据） --------------------
+    basket_manager = game_manager = None
+    if goods_category in _BASKET_CATS:
+        basket_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Basket.info",
         )
-        files_to_save.append(("Basket.info", basket_manager))
         basket_data = basket_manager.read_section(section=account, create_if_not_exists=True) or {}
-        if goods_category in ("exp", "stamina","gift","fishing_bait"):
-            basket_manager.update_key(section=account, key=goods_name, value=basket_data.get(goods_name, 0) + 1)
-
-        elif goods_category == "fishing_rod":
-            if goods_name in basket_data:
-                return f"您已拥有鱼竿「{goods_name}」！若需更换耐久，请使用[修复 {goods_name}]功能"
-            basket_manager.update_key(section=account, key=goods_name,value=100)
+        if goods_category == "fishing_rod" and goods_name in basket_data:
+            return f"您已拥有鱼竿「{goods_name}」！若需更换耐久，请使用[修复 {goods_name}]功能"
 
     elif goods_category in ("game",):
-        game_manager = IniFileReader(
+        game_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Game.info",
@@ -226,24 +247,40 @@ def purchase(account,user_name,msg,path) -> str:
         game_data = game_manager.read_section(section=account, create_if_not_exists=True) or {}
         if game_data.get("game_id",0) == 0:
             return "当前未绑定逃跑吧少年手游账号！发送'绑定 游戏ID'可以进行绑定"
-        files_to_save.append(("Game.info", game_manager))
-        game_manager.update_key(section=account, key=goods_name, value=game_data.get(goods_name, 0) + 1)
-    # -------------------- 扣减 --------------------
-    shop_handler.update_data(key=f"{goods_name}.quantity", value=goods_quantity - 1,validate=True)
-    user_manager.update_key(section=account, key="coin", value=user_gold - goods_price)
-    # -------------------- 提交所有修改 --------------------
+
+    # -------------------- 事务提交（校验全部通过后才修改，块结束时各文件统一保存一次） --------------------
+    files_to_save: List[IniFileReader | ShopFileHandler] = [
+        user_manager,  # 用户金币数据
+        shop_handler  # 商店库存数据
+    ]
+    if basket_manager is not None:
+        files_to_save.append(basket_manager)
+    elif game_manager is not None:
+        files_to_save.append(game_manager)
+
     try:
-        for file_name, manager in files_to_save:
-            manager.save("utf-8")  # 保存钓鱼数据等其他文件
+        with transaction(*files_to_save):
+            if basket_manager is not None:
+                if goods_category in _STACKABLE_CATS:
+                    basket_manager.update_key(section=account, key=goods_name, value=basket_data.get(goods_name, 0) + 1)
+                else:
+                    basket_manager.update_key(section=account, key=goods_name,value=100)
+            elif game_manager is not None:
+                game_manager.update_key(section=account, key=goods_name, value=game_data.get(goods_name, 0) + 1)
+            # -------------------- 扣减 --------------------
+            shop_handler.update_data(key=f"{goods_name}.quantity", value=goods_quantity - 1,validate=True)
+            user_manager.update_key(section=account, key="coin", value=user_gold - goods_price)
     except Exception as e:
         logger.error(f"保存数据失败（用户[{account}]，商品[{goods_name}]）: {str(e)}")
         return "购买成功，但数据保存失败，请联系管理员！"
 
     # -------------------- 构造成功提示 --------------------
     effect_msg = goods_data.get("effect_msg", "祝您游戏愉快～")
-    success_tips = {
-        "game": f"购买成功！该商品{user_name}为群主礼物赠送，时间不固定！"
-    }.get(goods_category, f"购买成功！该{goods_name}已经放入[背包]，发送'使用 {goods_name}'即可使用！")
+    # 只格式化实际选中的那条提示
+    if goods_category == "game":
+        success_tips = f"购买成功！该商品{user_name}为群主礼物赠送，时间不固定！"
+    else:
+        success_tips = f"购买成功！该{goods_name}已经放入[背包]，发送'使用 {goods_name}'即可使用！"
 
     return f"{success_tips}\n{effect_msg}"
 
@@ -256,7 +293,7 @@ def basket(account: str, user_name: str, path) -> str:
     :return: 友好格式的购物篮信息或错误提示
     """
     try:
-        basket_manager = IniFileReader(
+        basket_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Basket.info",
@@ -275,19 +312,16 @@ def basket(account: str, user_name: str, path) -> str:
 
     for item, value in basket_data.items():
         # 处理钓鱼装备类物品（特殊格式）
-        if item in ["fishing_rod"]:
+        if item == "fishing_rod":
             # 验证数据格式：应为列表，元素为包含name和endurance的字典
             items_list.append(f"· {item}：{value}耐久")
-        # 处理普通物品（数值型数量）
+        # 处理普通物品（数值型数量）：读取器加载时已将数值转为 int/float，无需逐项 int() 与异常捕获
+        elif type(value) in (int, float):  # 用 type 精确匹配，排除 bool
+            if value > 0:  # 数量大于0才显示
+                items_list.append(f"· {item}：{int(value)}个")
         else:
-            # 兼容多种数值格式（字符串/数字）
-            try:
-                count = int(value)
-                if count > 0:  # 数量大于0才显示
-                    items_list.append(f"· {item}：{count}个")
-            except (ValueError, TypeError):
-                # 非数值类型或无法转换的情况（如"小心心=0"可能存储为字符串"0"）
-                logger.debug(f"用户{user_name}的{item}非数值类型，值：{value}")
+            # 非数值类型（如被写成文本的异常数据）
+            logger.debug("用户%s的%s非数值类型，值：%s", user_name, item, value)
 
     # 最终结果拼接（根据是否有有效物品显示不同内容）
     if items_list:
@@ -305,28 +339,26 @@ def check_goods( msg:str, path):
     :param path: 项目根路径
     :return: 商品信息描述或错误提示
     """
-    if not msg.startswith("查商品 "):
+    rest = msg.removeprefix("查商品 ")  # 前缀匹配与截取一次完成
+    if len(rest) == len(msg):
         return "查商品格式：查商品 商品名，如：查商品 小心心"
 
-    # 提取商品名（处理"查商品"后多个空格的情况）
-    parts = msg.split(maxsplit=1)  # 最多分割1次
-    if len(parts) < 2 or not parts[1].strip():
-        return "⚠️ 查询格式错误！请使用：查商品 商品名（如：查商品 小心心）"
-
-    good_name = parts[1].strip()
+    # 提取商品名（strip 同时处理"查商品"后多个空格的情况）
+    good_name = rest.strip()
     if not good_name:
-        return "⚠️ 商品名不能为空！请重新输入。"
+        return "⚠️ 查询格式错误！请使用：查商品 商品名（如：查商品 小心心）"
 
     try:
         # 初始化商店处理器（假设ShopFileHandler已正确实现）
-        shop_manager = ShopFileHandler(
+        shop_manager = get_json_handler(
+            ShopFileHandler,
             project_root=path,
             subdir_name="City/Set_up",
             file_relative_path="Shop.res",
             encoding="utf-8",
         )
         # 获取商品详情（若不存在返回空字典）
-        shop_data = shop_manager.get_item_info(good_name)
+        shop_data = shop_manager.data.get(good_name)
     except Exception as e:
         logger.error(f"初始化商品读取器错误！{str(e)}")
         return "😢 系统繁忙，商品查询暂时异常，请稍后重试！"
@@ -339,17 +371,8 @@ def check_goods( msg:str, path):
         return f"❌ 未找到商品「{good_name}」～猜你可能想找：{', '.join(similar_names)}"
 
     # -------------------- 信息格式化（结构化+可配置化） --------------------
-    # 类型映射（支持扩展新商品类型，如后续新增"装备"类）
-    CATEGORY_MAPPING = {
-        "fishing_rod": ("鱼竿", ["strength", "time"]),          # (类型名称, 关联字段列表)
-        "gift": ("礼物", ["charm_value"]),
-        "exp": ("经验类", ["exp_value"]),
-        "stamina": ("体力类", ["recover_value"]),
-        "fishing_bait": ("鱼饵", ["strength"]),
-        "game": ("游戏", []),
-    }
     # 获取类型名称和需要展示的字段（避免硬编码if-elif）
-    category_info = CATEGORY_MAPPING.get(shop_data.get("category"), ("未知类型", []))
+    category_info = _CATEGORY_MAPPING.get(shop_data.get("category"), ("未知类型", []))
     category_name, related_fields = category_info
 
     # 基础信息（必选字段）
@@ -365,35 +388,48 @@ def check_goods( msg:str, path):
     # 1. 类型相关属性（如魅力值、钓力等）
     for field in related_fields:
         value = shop_data.get(field, 0)
-        field_alias = {
-            "charm_value": "✨ 魅力值",
-            "exp_value": "✨ 经验值",
-            "recover_value": "✨ 体力值",
-            "strength": "🎣 钓力",
-            "time": "⏱️ 时间窗"
-        }.get(field)  # 字段别名映射（避免硬编码字段名）
+        field_alias = _FIELD_ALIAS[field]
         ext_info.append(f"{field_alias}：{value} 点" if field != "time" else f"{field_alias}：{value} 秒")
 
     # 通用描述（必选）
     ext_info.append(f"📝 描述：{shop_data.get("effect_msg", "无效果描述")}")
     ext_info.append(f"ℹ️ 购买方法：购买 {good_name}")
     # 合并基础信息与扩展信息（基础信息后空一行，扩展信息用短横线分隔）
-    all_info = base_info + ["---", *ext_info]
-    return "\n".join(all_info)
+    base_info.append("---")
+    base_info.extend(ext_info)
+    return "\n".join(base_info)
+
+def _resolve_item(basket_manager: IniFileReader, shop_manager: ShopFileHandler, account: str, good_name: str):
+    """
+    一次取出用户持有数量与商品信息（只按键读取，不复制整节数据）
+    :return: (持有数量, 商品详情)；用户未拥有时返回 (None, None)，商店不存在该商品时商品详情为 None
+    """
+    try:
+        current_amount = basket_manager.read_key(section=account, key=good_name)
+    except ValueError:
+        return None, None
+    return current_amount, shop_manager.data.get(good_name)
 
 def use(account,user_name,msg,path) -> str:
     if not msg.startswith("使用 "):
         return f"{user_name} 使用方法：使用 物品。各项物品可前往[商店]查看"
 
+    # 提取商品名（处理"查商品"后多个空格的情况；格式错误时不读取任何文件）
+    parts = msg.split(maxsplit=1)  # 最多分割1次
+    if len(parts) < 2 or not parts[1].strip():
+        return "⚠️ 使用格式错误！请使用：使用 商品名（如：使用 经验药水）"
+    # 适配含艾特的情况 使用 XX[at:XX]
+    good_name,target_qq = get_by_qq(msg)
+
     try:
-        basket_manager = IniFileReader(
+        basket_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Basket.info",
             encoding="utf-8",
         )
-        basket_data = basket_manager.read_section(section=account, create_if_not_exists=True)
-        shop_manager = ShopFileHandler(
+        shop_manager = get_json_handler(
+            ShopFileHandler,
             project_root=path,
             subdir_name="City/Set_up",
             file_relative_path="Shop.res",
@@ -402,25 +438,18 @@ def use(account,user_name,msg,path) -> str:
     except Exception as e:
         logger.error(f"读取配置错误！{str(e)}")
         return "系统繁忙，请稍后重试！"
-
-    # 提取商品名（处理"查商品"后多个空格的情况）
-    parts = msg.split(maxsplit=1)  # 最多分割1次
-    if len(parts) < 2 or not parts[1].strip():
-        return "⚠️ 使用格式错误！请使用：使用 商品名（如：使用 经验药水）"
-    # 适配含艾特的情况 使用 XX[at:XX]
-    good_name,target_qq = get_by_qq(msg)
-    if not good_name in basket_data:
+    current_amount, shop_data = _resolve_item(basket_manager, shop_manager, account, good_name)
+    if current_amount is None:
         return f"{user_name} 你未拥有该物品 {good_name}"
-    shop_data = shop_manager.get_item_info(good_name)
     if not shop_data:
         return f"{user_name} 数据库不存在该物品 {good_name}"
-    current_amount = basket_data.get(good_name, 0)
     if current_amount < 1:
         return f"{user_name} 你拥有的 {good_name} 数量不足（当前：{current_amount}）"
 
     good_category = shop_data.get("category")
-    if good_category in ["gift","exp","stamina"]:
-        user_manager = IniFileReader(
+    stat_keys = _STAT_DISPATCH.get(good_category)
+    if stat_keys is not None:
+        user_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Briefly.info",
@@ -430,27 +459,17 @@ def use(account,user_name,msg,path) -> str:
         if target_qq is None:
             # 如果使用对象未指定，则给自身使用
             target_qq = account
-        account_data = user_manager.read_section(section=target_qq, create_if_not_exists=True)
 
         new_amount = current_amount - 1
-        basket_manager.update_key(section=account,key=good_name,value=new_amount)
-
-        goods_category = {
-            "gift": {"account_key": "charm", "shop_key": "charm_value"},
-            "exp": {"account_key": "exp", "shop_key": "exp_value"},
-            "stamina": {"account_key": "stamina", "shop_key": "recover_value"},
-        }
-        category_info = goods_category.get(good_category)
-        new_charm = account_data.get(category_info.get("account_key"), 0) + shop_data.get(category_info.get("shop_key"), 0)
-        user_manager.update_key(section=target_qq,
-                                key=category_info.get("account_key"),
-                                value=new_charm)
-        user_manager.save(encoding="utf-8")
-        basket_manager.save(encoding="utf-8")
+        account_key, shop_key = stat_keys
+        new_value = user_manager.read_key(section=target_qq, key=account_key, default=0) + shop_data.get(shop_key, 0)
+        with transaction(user_manager, basket_manager):
+            basket_manager.update_key(section=account,key=good_name,value=new_amount)
+            user_manager.update_key(section=target_qq, key=account_key, value=new_value)
         return f"{user_name} 成功使用 {good_name}！"
     elif good_category in ("fishing_rod", "fishing_bait"):
         try:
-            fish_manager = IniFileReader(
+            fish_manager = get_ini_reader(
                 project_root=path,
                 subdir_name="City/Record",
                 file_relative_path="Fish.data",
@@ -1,10 +1,9 @@
 from astrbot.api import logger
 
 from model import constants
-from model.data_managers import IniFileReader
-from model.city_func import preprocess_date_str, calculate_delta_days
+from model.data_managers import get_ini_reader, transaction
+from model.city_func import preprocess_date_str, calculate_delta_days, get_today_str
 
-from datetime import datetime
 import random
 from pathlib import Path
 
@@ -27,20 +26,20 @@ def check_in(account:str,user_name:str,path:Path)->str:
     :return: 签到结果提示（含随机趣味文案）
     """
     # ---------------------- 数据管理器初始化 ----------------------
-    sign_reader  = IniFileReader(
+    sign_reader  = get_ini_reader(
         project_root=path,
         subdir_name="City/Record",
         file_relative_path="Sign_in.data",
         encoding="utf-8"
                          )
-    user_reader = IniFileReader(
+    user_reader = get_ini_reader(
         project_root=path,
         subdir_name="City/Personal",
         file_relative_path="Briefly.info",
         encoding="utf-8"
     )
     # -------------------- 读取/初始化签到数据 --------------------
-    today_str = datetime.now().strftime("%Y-%m-%d")
+    today_str = get_today_str()
     # 处理上次签到时间（兼容旧格式）
     sign_data = sign_reader.read_section(account, create_if_not_exists=True)
     last_sign_str = preprocess_date_str(sign_data.get("sign_time", "1970-01-01"))
@@ -88,35 +87,42 @@ def check_in(account:str,user_name:str,path:Path)->str:
         accumulated_days += 1  # 累计天数始终+1
 
 
-    # -------------------- 更新签到数据 --------------------
-    sign_reader.update_section_keys(account, {
-        "sign_time": today_str,
-        "continuous_clock-in": continuous_days,
-        "accumulated_clock-in": accumulated_days
-    })
-
-    # -------------------- 更新用户属性（金币/经验） --------------------
-    # -------------------- 读取/初始化用户属性 --------------------
-    user_section = user_reader.read_section(account, create_if_not_exists=True)
-    current_coin = user_section.get("coin", 0)  # 当前金币（默认0）
-    current_exp = user_section.get("exp", 0)    # 当前经验（默认0）
-    current_stamina = user_section.get("stamina", 0)  # 当前经验（默认0）
-    # 计算新值（防止负数）
-    new_coin = max(current_coin + reward_coin, 0)
-    new_exp = max(current_exp + reward_exp, 0)
-    new_stamina = max(current_stamina + reward_stamina, 0)
-    # 准备用户属性更新
-    user_reader.update_section_keys(account, {
-        "coin": new_coin,
-        "exp": new_exp,
-        "stamina":new_stamina
-    })
-    # -------------------- 保存双文件变更 --------------------
-    sign_reader.save(encoding="utf-8")  # 保存签到数据
-    user_reader.save(encoding="utf-8")  # 保存用户属性
+    # -------------------- 更新签到数据与用户属性（块结束时双文件统一提交） --------------------
+    with transaction(sign_reader, user_reader):
+        sign_reader.update_section_keys(account, {
+            "sign_time": today_str,
+            "continuous_clock-in": continuous_days,
+            "accumulated_clock-in": accumulated_days
+        })
+
+        # -------------------- 更新用户属性（金币/经验） --------------------
+        # -------------------- 读取/初始化用户属性 --------------------
+        user_section = user_reader.read_section(account, create_if_not_exists=True)
+        current_coin = user_section.get("coin", 0)  # 当前金币（默认0）
+        current_exp = user_section.get("exp", 0)    # 当前经验（默认0）
+        current_stamina = user_section.get("stamina", 0)  # 当前经验（默认0）
+        # 计算新值（防止负数）
+        new_coin = max(current_coin + reward_coin, 0)
+        new_exp = max(current_exp + reward_exp, 0)
+        new_stamina = max(current_stamina + reward_stamina, 0)
+        # 准备用户属性更新
+        user_reader.update_section_keys(account, {
+            "coin": new_coin,
+            "exp": new_exp,
+            "stamina":new_stamina
+        })
 
     return f"{result_msg}\n{random.choice(constants.CHECK_IN_RANDOM_TIPS)}"
 
+# 用户信息字段配置（属性名、显示名称、单位）
+_QUERY_FIELDS = (
+    ("level", "等级", "级"),
+    ("exp", "经验", "点"),
+    ("coin", "金币", "个"),
+    ("charm", "魅力", "点"),
+    ("stamina", "体力", "点")
+)
+
 def query(account: str, user_name: str, path:Path) -> str:
     """
     查询用户信息
@@ -127,36 +133,24 @@ def query(account: str, user_name: str, path:Path) -> str:
     """
     try:
         # 初始化INI读取器（自动处理文件/节不存在）
-        file = IniFileReader(
+        file = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Briefly.info",
             encoding="utf-8"
         )
 
-        # 读取用户数据（节不存在时自动创建空Section）
-        account_data = file.read_section(account, create_if_not_exists=True)
+        # 读取用户数据（只读查询，节不存在时返回空字典，各字段按 0 显示）
+        account_data = file.read_section(account)
 
         # ------------------------------ 动态生成用户信息内容 ------------------------------
-        # 定义用户信息字段配置（属性名、显示名称、单位）
-        user_info_fields = [
-            ("level", "等级", "级"),
-            ("exp", "经验", "点"),
-            ("coin", "金币", "个"),
-            ("charm", "魅力", "点"),
-            ("stamina", "体力", "点")
-        ]
-
-        # 动态拼接信息内容（通过配置生成，避免重复代码）
-        content_lines = []
-        for field_key, display_name, unit in user_info_fields:
-            value = account_data.get(field_key, 0)  # 统一处理默认值
-            content_lines.append(f"▸{display_name}：{value} {unit}")
-
-            # 组合头部与内容（保持友好格式）
-        header = f"你好呀，{user_name}👋～\n—————————\n"
-        content = "\n".join(content_lines)
-        return f"{header}{content}"
+        # 头部与各字段行收集到同一个列表，最后只 join 一次（字段由模块级配置生成，统一处理默认值）
+        lines = [f"你好呀，{user_name}👋～", "—————————"]
+        lines.extend(
+            f"▸{display_name}：{account_data.get(field_key, 0)} {unit}"
+            for field_key, display_name, unit in _QUERY_FIELDS
+        )
+        return "\n".join(lines)
 
     except Exception as e:
         # 优化异常提示语气
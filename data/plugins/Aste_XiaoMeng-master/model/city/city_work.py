@@ -1,19 +1,33 @@
 from astrbot.api import logger
 
-from model.data_managers import JobFileHandler,IniFileReader
-from model.city_func import is_arabic_digit, format_salary
+from model.data_managers import JobFileHandler,IniFileReader,get_ini_reader,transaction
+from model.city_func import format_salary, get_today_str, is_arabic_digit
 from model import constants
 
-from collections import defaultdict
-import math
+from collections import Counter
+from itertools import groupby, islice
+from operator import itemgetter
 import random
+import re
 import time
 from typing import Dict, List, Tuple
-from datetime import datetime
 
-def work_menu() -> str:
+_PAGE_NUM_RE = re.compile(r'\d+')  # 招聘市场页码（匹配任意位置的数字）
+# 工作数据初始状态（清除工作时整节写回）
+_WORK_INITIAL = {
+    "job_id": 0,
+    "job_name": '',
+    "join_date": '1970-01-01',
+    "work_date": '1970-01-01',
+    "work_time": 0,
+    "work_count": 0,
+    "overtime_count": 0
+}
+
+def _build_work_menu() -> str:
     """
-    构建并返回打工系统主菜单字符串，包含基础操作、工作管理、进阶操作等分组说明。
+    构建打工系统主菜单字符串，包含基础操作、工作管理、进阶操作等分组说明。
+    菜单内容全部为静态文本，仅在模块加载时调用一次。
     :return: 菜单文本
     """
     # ---------------------- 菜单内容定义 ----------------------
@@ -50,6 +64,15 @@ def work_menu() -> str:
     menu_lines.append("——————————————\n 输入对应关键词即可操作")
     return f"{welcome_msg}{"\n".join(menu_lines)}"
 
+_WORK_MENU_STR = _build_work_menu()
+
+def work_menu() -> str:
+    """
+    返回打工系统主菜单字符串（模块加载时已构建好）
+    :return: 菜单文本
+    """
+    return _WORK_MENU_STR
+
 def work(account,user_name,path,job_manager:JobFileHandler)->str:
     """
     执行打工操作：校验用户是否有工作、体力是否足够、是否已打工，更新打工状态和体力。
@@ -72,13 +95,13 @@ def work(account,user_name,path,job_manager:JobFileHandler)->str:
     "submit_count": 0
     """
     try:
-        work_manager = IniFileReader(
+        work_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Record",
             file_relative_path="Work.data",
             encoding="utf-8"
         )
-        work_data = work_manager.read_section(account, create_if_not_exists=True) or {}
+        work_data = work_manager.read_section(account) or {}
     except Exception as e:
         logger.error(f"打工读取错误：{str(e)}")
         return "系统繁忙，请稍后重试"
@@ -93,49 +116,49 @@ def work(account,user_name,path,job_manager:JobFileHandler)->str:
     if not job_data:
         # 工作数据异常
         _work_clear(account, work_manager)
-        return random.choice(constants.WORK_ERROR_TEXTS)(job_name)
+        return random.choice(constants.WORK_ERROR_TEXTS)(user_name)
 
     job_stamina = job_data.get("physicalConsumption",0)
 
-    user_manager = IniFileReader(
-        project_root=path,
-        subdir_name="City/Personal",
-        file_relative_path="Briefly.info",
-        encoding="utf-8"
-    )
-    user_stamina = user_manager.read_key(section=account, key="stamina",default=0)
-    if job_stamina > user_stamina:
-        return "体力不足，无法进行[打工]！"
-    work_date = datetime.strptime(work_data.get("work_date", "1970-01-01"), "%Y-%m-%d").date()
-    now_date = datetime.now().date()
-    if work_date != now_date:
-        # clear work_time，overtime_count
-        work_manager.update_section_keys(account, {
-            "work_date": now_date.strftime("%Y-%m-%d"),
-            "work_time": 0,
-            "work_count": 0,
+    # 获取现在时间戳（日期与计时共用同一时刻）
+    now_time = time.time()
+    # 日期固定以 YYYY-MM-DD 存储，直接比较字符串，无需 strptime 解析
+    today_str = get_today_str(now_time)
+    day_reset = {}
+    if work_data.get("work_date", "1970-01-01") != today_str:
+        # 新的一天：当日计数只在内存中清零，随下面的打工记录一次写入
+        day_reset = {
+            "work_date": today_str,
             "overtime_count": 0
-        })
+        }
         work_time = 0
         work_count = 0
     else:
         work_time = work_data.get("work_time", 0)
         work_count = work_data.get("work_count", 0)
 
-    # 获取现在时间戳
-    now_time = time.time()
     if work_time == 0:
         if work_count == 0:
-            # 记录打工
-            work_manager.update_section_keys(account, {
-                "work_time": now_time,
-                "work_count": 1
-            })
-            work_manager.save(encoding="utf-8")
-            # 消耗体力
-            new_stamina = user_stamina - job_stamina
-            user_manager.update_key(section=account, key="stamina", value=new_stamina)
-            user_manager.save(encoding="utf-8")
+            # 只有真正开始打工时才需要体力，此时再读取 Briefly.info
+            user_manager = get_ini_reader(
+                project_root=path,
+                subdir_name="City/Personal",
+                file_relative_path="Briefly.info",
+                encoding="utf-8"
+            )
+            user_stamina = user_manager.read_key(section=account, key="stamina",default=0)
+            if job_stamina > user_stamina:
+                return "体力不足，无法进行[打工]！"
+            with transaction(work_manager, user_manager):
+                # 记录打工（跨天时连同当日重置一起更新）
+                work_manager.update_section_keys(account, {
+                    **day_reset,
+                    "work_time": now_time,
+                    "work_count": 1
+                })
+                # 消耗体力
+                new_stamina = user_stamina - job_stamina
+                user_manager.update_key(section=account, key="stamina", value=new_stamina)
             return random.choice(constants.WORK_START_WORK_TEXTS)(user_name,job_name)
         else:
             # 今日已经打工，无需再次打工
@@ -146,7 +169,7 @@ def work(account,user_name,path,job_manager:JobFileHandler)->str:
             return random.choice(constants.WORK_REWARD_READY_TEXTS)(user_name,job_name)
 
         remaining = work_time + constants.WORK_DURATION_SECONDS - now_time
-        minutes = math.ceil(remaining / 60)
+        minutes = int(-(-remaining // 60))  # 向上取整到分钟（整除取反，无需 math.ceil）
         return random.choice(constants.WORK_WORKING_TEXTS)(user_name,job_name,minutes)
 
 def overwork(account,user_name,path,job_manager:JobFileHandler)->str:
@@ -159,13 +182,13 @@ def overwork(account,user_name,path,job_manager:JobFileHandler)->str:
     :return: 操作结果提示文本
     """
     # ---------------------- 初始化数据管理器 ----------------------
-    work_manager = IniFileReader(
+    work_manager = get_ini_reader(
         project_root=path,
         subdir_name="City/Record",
         file_relative_path="Work.data",
         encoding="utf-8"
     )
-    work_data: Dict[str, str] = work_manager.read_section(account, create_if_not_exists=True) or {}
+    work_data: Dict[str, str] = work_manager.read_section(account) or {}
     # ---------------------- 检查是否拥有有效工作 ----------------------
     job_id = work_data.get("job_id",0)
     job_name = work_data.get("job_name","")
@@ -177,49 +200,46 @@ def overwork(account,user_name,path,job_manager:JobFileHandler)->str:
     if not job_data:
         # 清除异常工作数据并提示
         _work_clear(account, work_manager)
-        return random.choice(constants.WORK_ERROR_TEXTS)(job_name)
+        return random.choice(constants.WORK_ERROR_TEXTS)(user_name)
     job_stamina = job_data.get("physicalConsumption", 0)
-    user_manager = IniFileReader(
-        project_root=path,
-        subdir_name="City/Personal",
-        file_relative_path="Briefly.info",
-        encoding="utf-8"
-    )
-    user_stamina = user_manager.read_key(section=account, key="stamina",default=0)
-    if user_stamina < job_stamina:
-        return "体力不足，请获取体力再[加班]吧！"
 
-    work_date = datetime.strptime(work_data.get("work_date", "1970-01-01"), "%Y-%m-%d").date()
-    if work_date != datetime.now().date():
+    # 获取现在时间戳（日期与计时共用同一时刻）
+    now_time = time.time()
+    if work_data.get("work_date", "1970-01-01") != get_today_str(now_time):
         # 提示开始打工而不是加班
         return random.choice(constants.WORK_DATE_RESET_TIPS)(user_name)
 
     # ---------------------- 处理加班逻辑 ----------------------
     overtime_count = work_data.get("overtime_count", 0)
     work_time = work_data.get("work_time", 0)
-    # 获取现在时间戳
-    now_time = time.time()
 
     if work_time == 0:
-        # 未开始加班
+        # 未开始加班：只有此时才需要体力，再读取 Briefly.info
+        user_manager = get_ini_reader(
+            project_root=path,
+            subdir_name="City/Personal",
+            file_relative_path="Briefly.info",
+            encoding="utf-8"
+        )
+        user_stamina = user_manager.read_key(section=account, key="stamina",default=0)
+        if user_stamina < job_stamina:
+            return "体力不足，请获取体力再[加班]吧！"
         overtime_count += 1
-        work_manager.update_section_keys(account, {
-            "work_time": now_time,
-            "overtime_count": overtime_count
-        })
-        work_manager.save(encoding="utf-8")
-        new_stamina = user_stamina - job_stamina
-        user_manager.update_key(section=account,key="stamina",value=new_stamina)
-        user_manager.save(encoding="utf-8")
-        return random.choice(constants.WORK_START_WORKOVER_TEXTS(user_name,job_name))  # 随机选择未开始提示
+        with transaction(work_manager, user_manager):
+            work_manager.update_section_keys(account, {
+                "work_time": now_time,
+                "overtime_count": overtime_count
+            })
+            new_stamina = user_stamina - job_stamina
+            user_manager.update_key(section=account,key="stamina",value=new_stamina)
+        return random.choice(constants.WORK_START_WORKOVER_TEXTS)(user_name,job_name)  # 随机选择未开始提示
     else:
         # 已开始加班：计算当前状态
-        now_time = time.time()
         if work_time + constants.WORK_DURATION_SECONDS <= now_time:
             return random.choice(constants.WORK_REWARD_READY_TEXTS)(user_name,job_name)  # 随机选择可领工资提示
         else:
             remaining = work_time + constants.WORK_DURATION_SECONDS - now_time
-            minutes = math.ceil(remaining / 60)
+            minutes = int(-(-remaining // 60))  # 向上取整到分钟（整除取反，无需 math.ceil）
             return random.choice(constants.WORK_WORKING_TEXTS)(user_name,job_name,minutes)
 
 def job_hunting(msg: str,job_manager:JobFileHandler) -> str:
@@ -233,14 +253,8 @@ def job_hunting(msg: str,job_manager:JobFileHandler) -> str:
     if not job_manager.data:
         return "⚠️ 职位数据库为空，请联系管理员初始化数据！"
 
-    # -------------------- 收集所有有效职位ID（按数字升序排序） --------------------
-    all_jobs = []
-    # 按series_key的数字顺序遍历（如"20"→"30"→"40"）
-    for series_key in sorted(job_manager.data.keys(), key=lambda x: int(x)):
-        # 按job_id的数字顺序遍历（如"2000"→"2001"→"2002"）
-        for job_id_str in sorted(job_manager.data[series_key].keys(), key=lambda x: int(x)):
-            if len(job_id_str) == 4 and job_id_str.isdigit():
-                all_jobs.append(job_id_str)
+    # -------------------- 所有有效职位ID（按数字升序，由职位管理器缓存） --------------------
+    all_jobs = job_manager.get_all_job_ids()
 
     # -------------------- 分页逻辑处理（修正输入解析） --------------------
     page_size = constants.JOB_HUNTING_PAGE_SIZE
@@ -248,8 +262,7 @@ def job_hunting(msg: str,job_manager:JobFileHandler) -> str:
     current_page = 1  # 默认第一页
 
     # 提取用户输入的页码（支持"找工作 2"或"找工作 第2页"格式）
-    import re
-    page_match = re.search(r'\d+', msg)  # 匹配任意位置的数字
+    page_match = _PAGE_NUM_RE.search(msg)  # 匹配任意位置的数字
     if page_match:
         try:
             current_page = int(page_match.group())
@@ -257,9 +270,29 @@ def job_hunting(msg: str,job_manager:JobFileHandler) -> str:
         except ValueError:
             pass  # 无效数字则保持默认
 
-    # -------------------- 构建输出内容 --------------------
+    # -------------------- 构建输出内容（同一页的渲染结果在职位数据变化前复用） --------------------
+    page_body = job_manager.cached_render(
+        "job_hunting", current_page,
+        lambda: _render_job_page(job_manager, all_jobs[(current_page-1)*page_size : current_page*page_size])
+    )
+
+    # -------------------- 生成分页导航 --------------------
+    pagination_info = (
+        f"\n---------第{current_page}/{total_pages}页---------"
+        f"\n'找工作 X' '查工作 X' 查询"
+    )
+
+    return page_body + pagination_info
+
+def _render_job_page(job_manager: JobFileHandler, page_job_ids) -> str:
+    """
+    渲染招聘市场一页的职位列表（不含分页导航）
+    :param job_manager: 职位数据管理器
+    :param page_job_ids: 本页的职位ID
+    :return: 职位列表文本
+    """
     output_lines = ["★★★★ 招聘市场 ★★★★"]
-    for job_id_str in all_jobs[(current_page-1)*page_size : current_page*page_size]:
+    for job_id_str in page_job_ids:
         try:
             job_details = job_manager.get_job_info(job_id_str)
             base_salary = job_details["baseSalary"]
@@ -279,19 +312,13 @@ def job_hunting(msg: str,job_manager:JobFileHandler) -> str:
             output_lines.append(job_entry)
 
         except KeyError as e:
-            print(f"警告：职位 {job_id_str} 数据缺失，跳过显示。错误详情：{e}")
+            logger.warning("职位 %s 数据缺失，跳过显示。错误详情：%s", job_id_str, e)
             continue
         except Exception as e:
-            print(f"警告：处理职位 {job_id_str} 时发生异常，跳过显示。错误详情：{e}")
+            logger.warning("处理职位 %s 时发生异常，跳过显示。错误详情：%s", job_id_str, e)
             continue
 
-    # -------------------- 生成分页导航 --------------------
-    pagination_info = (
-        f"\n---------第{current_page}/{total_pages}页---------"
-        f"\n'找工作 X' '查工作 X' 查询"
-    )
-
-    return "\n".join(output_lines) + pagination_info
+    return "\n".join(output_lines)
 
 def job_hopping(account,user_name,path,job_manager:JobFileHandler) -> str:
     """
@@ -302,70 +329,69 @@ def job_hopping(account,user_name,path,job_manager:JobFileHandler) -> str:
     :param job_manager: 职位数据管理器
     :return: 操作结果提示文本
     """
-    work_manager = IniFileReader(
+    work_manager = get_ini_reader(
         project_root=path,
         subdir_name="City/Record",
         file_relative_path="Work.data",
         encoding="utf-8"
     )
-    work_data = work_manager.read_section(account, create_if_not_exists=True)
+    work_data = work_manager.read_section(account)
     job_id = work_data.get("job_id",0)
     job_name = work_data.get("job_name",None)
     if job_id == 0 or not job_name:
         return random.choice(constants.WORK_NO_JOB_TEXTS)(user_name)
 
     # 检测今日跳槽
-    today_str = datetime.today().strftime("%Y-%m-%d")
+    today_str = get_today_str()
     job_hop_date = work_data.get("hop_date")
     if job_hop_date == today_str:
         return random.choice(constants.JOB_HOPPING_LIMIT_TEXTS)(user_name)  # 随机选择今日限制提示
 
-    work_manager.update_key(section=account, key='hop_date', value=today_str)
-    work_manager.save(encoding="utf-8")
-
-    next_job_data = job_manager.get_next_job_info(str(job_id))
-    if not next_job_data:
-        return random.choice(constants.JOB_HOPPING_MAX_POSITION_TEXTS)(user_name)
-
-    user_manager = IniFileReader(
+    user_manager = get_ini_reader(
         project_root=path,
         subdir_name="City/Personal",
         file_relative_path="Briefly.info",
         encoding="utf-8"
     )
-    user_data = user_manager.read_section(account, create_if_not_exists=True)
-
-    # 提取职位要求和用户属性（避免KeyError）
-    next_req = next_job_data.get("recruitRequirements", {})
-    user_level = user_data.get("level", 0)
-    user_exp = user_data.get("exp", 0)
-    user_coin = user_data.get("coin", 0)
-    user_charm = user_data.get("charm", 0)
-
-    req_level = next_req.get("level", 0)
-    req_exp = next_req.get("experience", 0)
-    req_gold = next_req.get("gold", 0)
-    req_charm = next_req.get("charm", 0)
-
-    if (req_level < user_level and
-            req_exp < user_exp and
-            req_gold <= user_coin and  # 确保金币足够支付
-            req_charm < user_charm):
-        work_manager.update_section_keys(
-            section=account,
-            data={
-            "job_id": next_job_data.get("jobid"),
-            "job_name": next_job_data.get("jobName"),
-            "join_date": today_str
-        }
-        )
-        # 扣除金币并保存
-        new_coin = user_coin - req_gold
-        user_manager.update_key(section=account,key="coin",value=new_coin)
-        user_manager.save(encoding="utf-8")
-        work_manager.save(encoding="utf-8")
-        return random.choice(constants.JOB_HOPPING_SUCCESS_TEXTS)(user_name)  # 随机选择成功提示
-    return random.choice(constants.JOB_HOPPING_FAILED_TEXTS)(user_name) # 随机选择失败提示
+    # 今日跳槽记录在任何结果下都要落盘；成功时与职位、金币变更一起提交，Work.data 只写一次
+    with transaction(work_manager, user_manager):
+        work_manager.update_key(section=account, key='hop_date', value=today_str)
+
+        next_job_data = job_manager.get_next_job_info(str(job_id))
+        if not next_job_data:
+            return random.choice(constants.JOB_HOPPING_MAX_POSITION_TEXTS)(user_name)
+
+        user_data = user_manager.read_section(account)
+
+        # 提取职位要求和用户属性（避免KeyError）
+        next_req = next_job_data.get("recruitRequirements", {})
+        user_level = user_data.get("level", 0)
+        user_exp = user_data.get("exp", 0)
+        user_coin = user_data.get("coin", 0)
+        user_charm = user_data.get("charm", 0)
+
+        req_level = next_req.get("level", 0)
+        req_exp = next_req.get("experience", 0)
+        req_gold = next_req.get("gold", 0)
+        req_charm = next_req.get("charm", 0)
+
+        if (req_level < user_level and
+                req_exp < user_exp and
+                req_gold <= user_coin and  # 确保金币足够支付
+                req_charm < user_charm):
+            work_manager.update_section_keys(
+                section=account,
+                data={
+                "job_id": next_job_data.get("jobid"),
+                "job_name": next_job_data.get("jobName"),
+                "join_date": today_str
+            }
+            )
+            # 扣除金币
+            new_coin = user_coin - req_gold
+            user_manager.update_key(section=account,key="coin",value=new_coin)
+            return random.choice(constants.JOB_HOPPING_SUCCESS_TEXTS)(user_name)  # 随机选择成功提示
+        return random.choice(constants.JOB_HOPPING_FAILED_TEXTS)(user_name) # 随机选择失败提示
 
 def get_paid(account,user_name,path,job_manager:JobFileHandler) -> str:
     """
@@ -377,14 +403,14 @@ def get_paid(account,user_name,path,job_manager:JobFileHandler) -> str:
     :return: 操作结果提示文本
     """
     # ---------------------- 初始化数据管理器 ----------------------
-    work_manager = IniFileReader(
+    work_manager = get_ini_reader(
         project_root=path,
         subdir_name="City/Record",
         file_relative_path="Work.data",
         encoding="utf-8"
     )
     # ---------------------- 检查是否拥有有效工作 ----------------------
-    work_data = work_manager.read_section(account, create_if_not_exists=True)
+    work_data = work_manager.read_section(account)
     job_id = work_data.get("job_id",0)
     if job_id == 0:
         return random.choice(constants.WORK_NO_JOB_TEXTS)(user_name)  # 随机选择无工作提示
@@ -393,19 +419,19 @@ def get_paid(account,user_name,path,job_manager:JobFileHandler) -> str:
     if not job_data:
         # 工作数据异常
         _work_clear(account, work_manager)
-        return random.choice(constants.WORK_ERROR_TEXTS)  # 随机选择信息错误提示
+        return random.choice(constants.WORK_ERROR_TEXTS)(user_name)  # 随机选择信息错误提示
     # ---------------------- 检查是否已开始工作 ----------------------
     work_time = work_data.get("work_time", 0)
     if work_time == 0:
-        return random.choice(constants.WORK_DATE_RESET_TIPS)  # 随机选择未开始提示
+        return random.choice(constants.WORK_DATE_RESET_TIPS)(user_name)  # 随机选择未开始提示
     now_time = time.time()
     required_time = work_time + constants.WORK_DURATION_SECONDS  # 预计完成时间戳（秒）
     if now_time < required_time:
         # 计算剩余时间（分钟）和进度百分比
-        remaining_minutes = int(required_time - now_time // 60)
-        return random.choice(constants.WORK_WORKING_TEXTS)(user_name,remaining_minutes)
+        remaining_minutes = int(-((now_time - required_time) // 60))  # 向上取整到分钟
+        return random.choice(constants.WORK_WORKING_TEXTS)(user_name,job_data.get("jobName", ""),remaining_minutes)
     # ---------------------- 计算用户当前金币并更新 ----------------------
-    user_manager = IniFileReader(
+    user_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Briefly.info",
@@ -415,12 +441,10 @@ def get_paid(account,user_name,path,job_manager:JobFileHandler) -> str:
     job_salary = job_data["baseSalary"]
 
     new_coin = current_coin + job_salary
-    user_manager.update_key(section=account, key="coin", value=new_coin)
-    user_manager.save(encoding="utf-8")
-
-    # ---------------------- 重置工作时间并保存 ----------------------
-    work_manager.update_key(section=account, key="work_time", value="0")  # 明确存储为字符串
-    work_manager.save(encoding="utf-8")
+    with transaction(user_manager, work_manager):
+        user_manager.update_key(section=account, key="coin", value=new_coin)
+        # ---------------------- 重置工作时间（与发薪一并保存） ----------------------
+        work_manager.update_key(section=account, key="work_time", value="0")  # 明确存储为字符串
 
     # ------------------------- 成功提示 -------------------------
     return random.choice(constants.GET_PAID_SUCCESS_TEXTS)(user_name,job_salary)
@@ -435,14 +459,14 @@ def resign(account,user_name,path,job_manager:JobFileHandler) -> str:
     :return: 操作结果提示文本
     """
     # ---------------------- 初始化数据管理器 ----------------------
-    work_manager = IniFileReader(
+    work_manager = get_ini_reader(
         project_root=path,
         subdir_name="City/Record",
         file_relative_path="Work.data",
         encoding="utf-8"
     )
     # ---------------------- 检查是否拥有有效工作 ----------------------
-    work_data = work_manager.read_section(account, create_if_not_exists=True) or {}
+    work_data = work_manager.read_section(account) or {}
     job_id = work_data.get("job_id",0)
     job_name = work_data.get("job_name",None)
     # 严格检查工作有效性（排除0、空字符串等情况）
@@ -458,7 +482,7 @@ def resign(account,user_name,path,job_manager:JobFileHandler) -> str:
     # ---------------------- 计算辞职赔偿金额 ----------------------
     resign_gold = job_data.get("baseSalary", 0)
     # ---------------------- 检查用户金币是否足够 ----------------------
-    user_manager = IniFileReader(
+    user_manager = get_ini_reader(
             project_root=path,
             subdir_name="City/Personal",
             file_relative_path="Briefly.info",
@@ -469,11 +493,10 @@ def resign(account,user_name,path,job_manager:JobFileHandler) -> str:
         return random.choice(constants.RESIGN_NOT_ENOUGH_TEXTS)(user_name,resign_gold, user_gold)
     # ---------------------- 执行辞职操作 ----------------------
     new_coin = user_gold - resign_gold
-    user_manager.update_key(account, "coin", new_coin)
-    user_manager.save(encoding="utf-8")
-    # 清除工作数据
-    _work_clear(account, work_manager)
-    work_manager.save(encoding="utf-8")
+    with transaction(user_manager, work_manager):
+        user_manager.update_key(account, "coin", new_coin)
+        # 清除工作数据
+        _work_clear(account, work_manager)
     # ---------------------- 返回成功提示 ----------------------
     return random.choice(constants.RESIGN_SUCCESS_TEXTS)(user_name, resign_gold, user_gold)
 
@@ -494,73 +517,114 @@ def check_job(msg,job_manager:JobFileHandler) -> str:
     # 提取ID
     target_id = parts[1]
 
-    # 步骤2：初始化职位管理器（需根据实际项目路径调整参数）
-        # 参数传入
-    # 步骤3：查询职位详情
+    # 步骤2：查询并格式化职位详情（职位数据变化前，相同查询直接复用渲染结果）
     if is_arabic_digit(target_id):
-        # 数字ID
-        job_detail = job_manager.get_job_info(str(target_id))
-
-        if not job_detail:
-            return f"未找到ID为 {target_id} 的职位信息，请检测该ID是否存在！"
-        # 步骤4：提取并格式化各字段
-        # 基础信息
-        job_name = job_detail["jobName"]
-        salary_str = format_salary(job_detail["baseSalary"])
-
-        # 招聘要求（包含基础要求和体力）
-        req = job_detail["recruitRequirements"]
-        physical = job_detail["physicalConsumption"]
-        req_str = f"等级{req['level']} 经验{req['experience']} 魅力{req['charm']}"
-
-        # 晋升链（通过管理器方法获取完整链）
-        promotion_chain = '→'.join(job_manager.get_promote_chain(target_id))
-
-        # 职位描述
-        description = job_detail["description"]
-
-        # 步骤5：组合输出（严格按示例格式）
-        return (f"ID: {target_id}\n"
-                f"所属：{job_detail['company']}\n"
-                f"工名：{job_name}\n"
-                f"工资：{salary_str}\n"
-                f"体耗：{physical}点\n"
-                f"要求：{req_str}\n"
-                f"晋升链：{promotion_chain}\n"
-                f"内容：{description}\n"
-                f"应聘：投简历 {target_id}")
-    else:
-        # 职位名
-        job_details = job_manager.get_job_info_ex(target_id)
-        more_jobs = ','.join([job["jobName"] for job in job_details[:3]])
-        job_detail = job_details[0]
-
-        if not job_detail:
-            return f"未找到ID为 {target_id} 的职位信息，请检测该ID是否存在！"
-
-        # 步骤4：提取并格式化各字段
-        # 基础信息
-        job_name = job_detail["jobName"]
-        salary_str = format_salary(job_detail["baseSalary"])
-
-        # 招聘要求（包含基础要求和体力）
-        req = job_detail["recruitRequirements"]
-        physical = job_detail["physicalConsumption"]
-        req_str = f"等级{req['level']} 经验{req['experience']} 魅力{req['charm']}"
-
-        # 职位描述
-        description = job_detail["description"]
-
-        # 步骤5：组合输出（严格按示例格式）
-        return (f"ID: {job_detail['jobid']}\n"
-                        f"所属：{job_detail['company']}\n"
-                        f"工名：{job_name}\n"
-                        f"工资：{salary_str}\n"
-                        f"体耗：{physical}点\n"
-                        f"要求：{req_str}\n"
-                        f"内容：{description}\n"
-                        f"应聘：投简历 {job_detail['jobid']}\n"
-                        f"相似职位：{more_jobs}")
+        # 数字ID（仅 0-9，全角数字按职位名处理）
+        return job_manager.cached_render("check_job", target_id, lambda: _format_job_detail(job_manager, target_id))
+    # 职位名
+    return job_manager.cached_render("check_job_name", target_id, lambda: _format_job_by_name(job_manager, target_id))
+
+# 职位详情输出模板（按ID查询 / 按名称查询），模块加载时绑定 str.format
+_JOB_DETAIL_TMPL = (
+    "ID: {id}\n所属：{company}\n工名：{name}\n工资：{salary}\n"
+    "体耗：{phys}点\n要求：{req}\n晋升链：{chain}\n内容：{desc}\n应聘：投简历 {id}"
+).format
+_JOB_BY_NAME_TMPL = (
+    "ID: {id}\n所属：{company}\n工名：{name}\n工资：{salary}\n"
+    "体耗：{phys}点\n要求：{req}\n内容：{desc}\n应聘：投简历 {id}\n相似职位：{more}"
+).format
+
+def _format_job_detail(job_manager: JobFileHandler, target_id: str) -> str:
+    """
+    按职位ID格式化职位详情
+    :param job_manager: 职位数据管理器
+    :param target_id: 职位ID（如"2000"）
+    :return: 职位详情文本
+    """
+    job_detail = job_manager.get_job_info(str(target_id))
+
+    if not job_detail:
+        return f"未找到ID为 {target_id} 的职位信息，请检测该ID是否存在！"
+    # 提取并格式化各字段
+    # 基础信息
+    job_name = job_detail["jobName"]
+    salary_str = format_salary(job_detail["baseSalary"])
+
+    # 招聘要求（包含基础要求和体力）
+    req = job_detail["recruitRequirements"]
+    physical = job_detail["physicalConsumption"]
+    req_str = f"等级{req['level']} 经验{req['experience']} 魅力{req['charm']}"
+
+    # 晋升链（通过管理器方法获取完整链）
+    promotion_chain = job_manager.get_promote_chain_str(target_id)
+
+    # 职位描述
+    description = job_detail["description"]
+
+    # 组合输出（严格按示例格式）
+    return _JOB_DETAIL_TMPL(id=target_id, company=job_detail['company'], name=job_name, salary=salary_str,
+                            phys=physical, req=req_str, chain=promotion_chain, desc=description)
+
+def _format_job_by_name(job_manager: JobFileHandler, job_name_kw: str) -> str:
+    """
+    按职位名称模糊匹配，格式化最相关职位的详情并附带相似职位
+    :param job_manager: 职位数据管理器
+    :param job_name_kw: 职位名称关键词
+    :return: 职位详情文本
+    """
+    job_details = job_manager.get_job_info_ex(job_name_kw)
+    # 先判空再取首条，避免无匹配时 IndexError
+    if not job_details:
+        return f"未找到名称包含 {job_name_kw} 的职位信息，请检测该职位是否存在！"
+    more_jobs = ','.join(job["jobName"] for job in islice(job_details, 3))
+    job_detail = job_details[0]
+
+    # 提取并格式化各字段
+    # 基础信息
+    job_name = job_detail["jobName"]
+    salary_str = format_salary(job_detail["baseSalary"])
+
+    # 招聘要求（包含基础要求和体力）
+    req = job_detail["recruitRequirements"]
+    physical = job_detail["physicalConsumption"]
+    req_str = f"等级{req['level']} 经验{req['experience']} 魅力{req['charm']}"
+
+    # 职位描述
+    description = job_detail["description"]
+
+    # 组合输出（严格按示例格式）
+    return _JOB_BY_NAME_TMPL(id=job_detail['jobid'], company=job_detail['company'], name=job_name, salary=salary_str,
+                             phys=physical, req=req_str, desc=description, more=more_jobs)
+
+_JOBS_POOL_PAGE_HINT = "工作池 X（分页查看职位，X为页码或公司名）"
+# 无职位数据时的职位池概览（固定文本）
+_JOBS_OVERVIEW_EMPTY = f"★ 所有职位概览 ★\n❌ 暂无职位数据\n{_JOBS_POOL_PAGE_HINT}"
+
+def _render_jobs_overview(all_jobs: List[Dict[str, str]]) -> str:
+    """
+    渲染职位池概览：总职位数、公司总数及各公司职位数（按公司名排序）
+    :param all_jobs: get_all_jobs_and_companies() 的结果（已保证含 jobName/company）
+    :return: 概览文本
+    """
+    # 无职位（新安装/数据清空）时直接返回预置文本
+    if not all_jobs:
+        return _JOBS_OVERVIEW_EMPTY
+
+    # 单次遍历统计各公司职位数
+    company_job_counts = Counter(job["company"] for job in all_jobs)
+
+    # 构建输出（添加符号，无空行）
+    output_lines = [
+        "★ 所有职位概览 ★",
+        f"▸ 总职位数：{len(all_jobs)}",
+        f"▸ 公司总数：{len(company_job_counts)}",
+        "▸ 公司列表（按名称排序）：",
+    ]
+    # 按公司名排序，确保输出顺序稳定
+    output_lines.extend(f"  - {company}（{company_job_counts[company]}职位）" for company in sorted(company_job_counts))
+    # 统一添加分页提示
+    output_lines.append(_JOBS_POOL_PAGE_HINT)
+    return '\n'.join(output_lines)
 
 def jobs_pool(msg: str,job_manager:JobFileHandler) -> str:
     """
@@ -578,116 +642,74 @@ def jobs_pool(msg: str,job_manager:JobFileHandler) -> str:
 
     args = parts[1:]  # 去除开头的"工作池"
 
-    # ---------------------- 读取职位数据（含异常处理） ----------------------
-    try:
-        all_jobs = job_manager.get_all_jobs_and_companies()  # 获取原始职位数据
-    except Exception as e:
-        logger.error(f"读取职位数据失败：{str(e)}", exc_info=True)
-        return "⚠️ 错误：无法读取职位数据，请稍后再试"
-
-    # ---------------------- 模式一：无参数，显示所有职位概览 ----------------------
+    # ---------------------- 选择展示模式（渲染结果在职位数据变化前直接复用） ----------------------
     if len(args) == 0:
-        # 统计公司职位数
-        company_job_counts: Dict[str, int] = defaultdict(int)
-        for job in all_jobs:
-            try:
-                company = job["company"]
-                company_job_counts[company] += 1
-            except KeyError as e:
-                logger.warning(f"跳过缺失字段 {e} 的职位：{job}")
-                continue
-
-        total_jobs = sum(company_job_counts.values())
-        companies = list(company_job_counts.keys())
-        company_count = len(companies)
-
-        # 构建输出（添加符号，无空行）
-        output_lines = ["★ 所有职位概览 ★"]
-        if total_jobs == 0:
-            output_lines.append("❌ 暂无职位数据")
-        else:
-            output_lines.append(f"▸ 总职位数：{total_jobs}")
-            output_lines.append(f"▸ 公司总数：{company_count}")
-            output_lines.append("▸ 公司列表（按名称排序）：")
-            # 按公司名排序，确保输出顺序稳定
-            for company in sorted(company_job_counts.keys()):
-                output_lines.append(f"  - {company}（{company_job_counts[company]}职位）")
-        # 统一添加分页提示（无论是否有数据）
-        output_lines.append("工作池 X（分页查看职位，X为页码或公司名）")
-        return '\n'.join(output_lines)
-
-    # ---------------------- 模式二：数字参数，分页显示所有职位 ----------------------
+        # 模式一：无参数，显示所有职位概览
+        view, key = "jobs_pool", None
+        render = lambda: _render_jobs_overview(job_manager.get_all_jobs_and_companies())
     elif args[0].isdigit():
+        # 模式二：数字参数，分页显示所有职位
         current_page = int(args[0])
         if current_page < 1:
             return "⚠️ 错误：页码不能小于1"
-
-        # 按公司分组并展开为全局职位列表（保留公司顺序）
-        grouped_jobs: Dict[str, List[str]] = defaultdict(list)
-        for job in all_jobs:
-            try:
-                company = job["company"]
-                job_name = job["jobName"]
-                grouped_jobs[company].append(job_name)
-            except KeyError as e:
-                logger.warning(f"跳过缺失字段 {e} 的职位：{job}")
-                continue
-
-        # 按公司名排序后展开为全局列表（确保分页顺序稳定）
-        sorted_companies = sorted(grouped_jobs.keys())
-        flattened_jobs: List[Tuple[str, str]] = []
-        for company in sorted_companies:
-            flattened_jobs.extend([(company, job) for job in grouped_jobs[company]])
-
-        total_jobs = len(flattened_jobs)
-        total_pages = (total_jobs + page_size - 1) // page_size if total_jobs > 0 else 0
-
-        # 处理无职位或页码越界
-        if total_jobs == 0:
-            return "★ 所有职位分页 ★\n❌ 暂无职位数据"
-        if current_page > total_pages:
-            return f"⚠️ 错误：当前页码 {current_page} 超过总页数 {total_pages}"
-
-        # 提取当前页数据并按公司分组
-        start_idx = (current_page - 1) * page_size
-        end_idx = start_idx + page_size
-        current_page_jobs = flattened_jobs[start_idx:end_idx]
-
-        # 按公司分组当前页的职位（保留当前页公司出现顺序）
-        page_companies: Dict[str, List[str]] = defaultdict(list)
-        for company, job in current_page_jobs:
-            page_companies[company].append(job)
-
-        # 构建输出（添加符号，无空行）
-        output_lines = [f"▶ 所有职位分页（第 {current_page} 页 / 共 {total_pages} 页，总职位数：{total_jobs}）"]
-        for company in sorted(page_companies.keys()):  # 按当前页公司名排序
-            jobs = page_companies[company]
-            output_lines.append(f"◆ {company}：")
-            output_lines.extend([f"  • {job}" for job in jobs])  # 职位前加•
-        return '\n'.join(output_lines)
-
-    # ---------------------- 模式三：公司名参数，显示该公司所有职位 ----------------------
+        view, key = "jobs_pool_page", current_page
+        render = lambda: _render_jobs_page(job_manager.get_flattened_jobs(), current_page, page_size)
     else:
+        # 模式三：公司名参数，显示该公司所有职位
         company_name = ' '.join(args)  # 合并参数为公司名（支持空格）
+        view, key = "jobs_pool_company", company_name
+        render = lambda: _render_company_jobs(company_name, job_manager.get_jobs_grouped_by_company().get(company_name, []))
 
-        # 筛选该公司下的所有职位
-        company_jobs: List[str] = []
-        for job in all_jobs:
-            try:
-                if job["company"] == company_name:
-                    company_jobs.append(job["jobName"])
-            except KeyError as e:
-                logger.warning(f"跳过缺失字段 {e} 的职位：{job}")
-                continue
-
-        # 构建输出（添加符号，无空行）
-        output_lines = [f"★ {company_name} 职位列表 ★"]
-        if not company_jobs:
-            output_lines.append("❌ 暂无相关职位数据")
-        else:
-            output_lines.append(f"（共 {len(company_jobs)} 个职位）")
-            output_lines.extend([f"  • {job}" for job in company_jobs])  # 职位前加•
-        return '\n'.join(output_lines)
+    # ---------------------- 读取职位数据并渲染（含异常处理） ----------------------
+    try:
+        return job_manager.cached_render(view, key, render)
+    except Exception as e:
+        logger.error(f"读取职位数据失败：{str(e)}", exc_info=True)
+        return "⚠️ 错误：无法读取职位数据，请稍后再试"
+
+def _render_jobs_page(flattened_jobs: List[Tuple[str, str]], current_page: int, page_size: int) -> str:
+    """
+    渲染职位池分页
+    :param flattened_jobs: 按公司名排序后展开的 (公司名, 职位名) 列表
+    :param current_page: 页码（从1开始）
+    :param page_size: 每页职位数
+    :return: 分页文本
+    """
+    total_jobs = len(flattened_jobs)
+    total_pages = (total_jobs + page_size - 1) // page_size if total_jobs > 0 else 0
+
+    # 处理无职位或页码越界
+    if total_jobs == 0:
+        return "★ 所有职位分页 ★\n❌ 暂无职位数据"
+    if current_page > total_pages:
+        return f"⚠️ 错误：当前页码 {current_page} 超过总页数 {total_pages}"
+
+    # 提取当前页数据（全局列表已按公司名排序，切片后同公司职位必然相邻）
+    start_idx = (current_page - 1) * page_size
+    current_page_jobs = flattened_jobs[start_idx:start_idx + page_size]
+
+    # 构建输出（添加符号，无空行）
+    output_lines = [f"▶ 所有职位分页（第 {current_page} 页 / 共 {total_pages} 页，总职位数：{total_jobs}）"]
+    for company, jobs in groupby(current_page_jobs, key=itemgetter(0)):
+        output_lines.append(f"◆ {company}：")
+        output_lines.extend(f"  • {job}" for _, job in jobs)  # 职位前加•
+    return '\n'.join(output_lines)
+
+def _render_company_jobs(company_name: str, company_jobs: List[str]) -> str:
+    """
+    渲染指定公司的职位列表
+    :param company_name: 公司名
+    :param company_jobs: 该公司的职位名列表
+    :return: 职位列表文本
+    """
+    # 构建输出（添加符号，无空行）
+    output_lines = [f"★ {company_name} 职位列表 ★"]
+    if not company_jobs:
+        output_lines.append("❌ 暂无相关职位数据")
+    else:
+        output_lines.append(f"（共 {len(company_jobs)} 个职位）")
+        output_lines.extend(f"  • {job}" for job in company_jobs)  # 职位前加•
+    return '\n'.join(output_lines)
 
 def submit_resume(account,user_name,msg,path,job_manager:JobFileHandler) -> str:
     """
@@ -699,14 +721,14 @@ def submit_resume(account,user_name,msg,path,job_manager:JobFileHandler) -> str:
     :param job_manager: 职位数据管理器
     :return: 操作结果提示文本
     """
-    work_manager = IniFileReader(
+    work_manager = get_ini_reader(
         project_root=path,
         subdir_name="City/Record",
         file_relative_path="Work.data",
         encoding="utf-8"
     )
     # ---------------------- 检查是否已有工作 ----------------------
-    work_data = work_manager.read_section(account,create_if_not_exists=True)
+    work_data = work_manager.read_section(account)
     if work_data.get('job_id',0) != 0:
         return "想投简历却不知道怎么做～正确姿势是'投简历 X'，X是职位ID（比如'投简历 1001'），再来一次？"
     # ---------------------- 处理"投简历"指令引导 ----------------------
@@ -728,15 +750,9 @@ def submit_resume(account,user_name,msg,path,job_manager:JobFileHandler) -> str:
         return "该职位已经被内定，你无法通过投简历的方式被雇用！"
 
     # ---------------------- 处理每日投递次数限制 ----------------------
-    today = datetime.now().date()
-    last_submit_date = datetime.strptime(work_data.get('submit_date', '1970-01-01'), "%Y-%m-%d").date()
-    if last_submit_date != today:
-        # 新日期重置计数
-        work_manager.update_section_keys(
-            section=account,
-            data={"submit_date": today.strftime("%Y-%m-%d"), "submit_count": 0}
-        )
-        work_manager.save(encoding="utf-8")
+    today_str = get_today_str()
+    if work_data.get('submit_date', '1970-01-01') != today_str:
+        # 新日期重置计数（只在内存中清零，随本次投递计数一起写入）
         current_submit_num = 0
     else:
         current_submit_num = work_data.get("submit_count", 0)
@@ -745,19 +761,18 @@ def submit_resume(account,user_name,msg,path,job_manager:JobFileHandler) -> str:
     if current_submit_num > constants.SUBMIT_RESUME_LIMIT:
         return random.choice(constants.SUBMIT_RESUME_LIMIT_TEXTS)(user_name,current_submit_num)
 
-    # 计数+1
+    # 计数+1（投递结果确定后与其他变更统一提交）
     current_submit_num += 1
-    work_manager.update_key(section=account,key="submit_count", value=current_submit_num)
-    work_manager.save(encoding="utf-8")
+    work_changes = {"submit_date": today_str, "submit_count": current_submit_num}
 
     # ---------------------- 读取用户数据并验证属性 ----------------------
-    user_manager = IniFileReader(
+    user_manager = get_ini_reader(
         project_root=path,
         subdir_name="City/Personal",
         file_relative_path="Briefly.info",
         encoding="utf-8"
     )
-    user_data: Dict[str, str] = user_manager.read_section(account, create_if_not_exists=True) or {}
+    user_data: Dict[str, str] = user_manager.read_section(account) or {}
 
     # 提取职位要求（带默认值防KeyError）
     req = job_data.get('recruitRequirements', {})
@@ -781,33 +796,32 @@ def submit_resume(account,user_name,msg,path,job_manager:JobFileHandler) -> str:
             user_stats['charm'] >= req_charm and
             user_stats['coin'] >= req_gold
     )
-    if condition_met:
-        # 扣除求职金币（确保金币非负）
-        new_coin = max(user_stats['coin'] - req_gold, 0)
-        new_exp = max(user_stats['exp'] - req_exp, 0)
-        user_manager.update_section_keys(
-            section=account,
-            data={
-                "coin": new_coin,
-                "exp": new_exp,
-            }
-        )
+    # 无论是否录用都要记录投递次数；Work.data 只写一次，未录用时 Briefly.info 无修改不会重写
+    with transaction(user_manager, work_manager):
+        if condition_met:
+            # 扣除求职金币（确保金币非负）
+            new_coin = max(user_stats['coin'] - req_gold, 0)
+            new_exp = max(user_stats['exp'] - req_exp, 0)
+            user_manager.update_section_keys(
+                section=account,
+                data={
+                    "coin": new_coin,
+                    "exp": new_exp,
+                }
+            )
 
-        # 更新工作信息（重置工作统计）
-        work_manager.update_section_keys(
-            section=account,
-            data={
+            # 更新工作信息（重置工作统计）
+            work_changes.update({
                 'job_id': target_job_id,
                 'job_name': job_name,
-                'join_date': today.strftime("%Y-%m-%d"),
+                'join_date': today_str,
                 'work_date': '1970-01-01',
                 'work_time': 0,
                 'overtime_count': 0
-            }
-        )
-        user_manager.save(encoding="utf-8")
-        work_manager.save(encoding="utf-8")
+            })
+        work_manager.update_section_keys(section=account, data=work_changes)
 
+    if condition_met:
         return random.choice(constants.SUBMIT_RESUME_SUCCESS_TEXTS)(user_name,job_name)
 
     return random.choice(constants.SUBMIT_RESUME_FAIL_TEXTS)(user_name,job_name,req_level,req_exp,req_charm,req_gold)
@@ -818,13 +832,4 @@ def _work_clear(account_id: str, manager: IniFileReader) -> None:
     :param account_id: 用户账号
     :param manager: 工作数据管理器
     """
-    initial_data = {
-        "job_id": 0,
-        "job_name": '',
-        "join_date": '1970-01-01',
-        "work_date": '1970-01-01',
-        "work_time": 0,
-        "work_count": 0,
-        "overtime_count": 0
-    }
-    manager.update_section_keys(account_id, initial_data)
\ No newline at end of file
+    manager.update_section_keys(account_id, _WORK_INITIAL)
\ No newline at end of file
@@ -4,21 +4,16 @@ from typing import Optional
 import aiohttp
 import asyncio
 import json
+import time
 
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 from PIL import ImageFont
 
 def is_arabic_digit(text: str) -> bool:
     """判断文本是否仅由 0-9 的阿拉伯数字组成"""
-    # 空文本直接返回 False
-    if len(text) == 0:
-        return False
-    # 遍历每个字符，检查是否全为 0-9
-    for char in text:
-        if not ('0' <= char <= '9'):
-            return False
-    return True
+    # isascii 排除全角数字等非 ASCII 数字字符；空文本 isdigit() 为 False
+    return text.isascii() and text.isdigit()
 
 def get_by_qq(content:str):
     """
@@ -28,39 +23,32 @@ def get_by_qq(content:str):
     :param content: 例如 'xx yy@zz(qq)' 或 'xx yy'
     :return: 元组 (yy, qq)，其中 qq 若无则返回 None；
     """
-    parts = content.split(' ', 1)
-    if len(parts) < 2:
+    # partition 一次切分即可同时得到分隔符是否存在，无需先 find 再 split
+    _, sep, s_rest = content.partition(' ')
+    if not sep:
         return None, None  # 没有空格分隔，格式不对
 
-    # 只处理第二部分：例如 'yy@zz(qq)' \
-    s_rest = parts[1]
-    if  s_rest.find('@') != -1:
-        # yy,qq
-        # 先提取 @ 前面的部分，即 yy
-        at_split = s_rest.split('@', 1)
-
-        yy = at_split[0]  # @ 前面的部分
-
-        # 剩下的部分是 zz(qq) 或 zz
-        after_at = at_split[1]
-
-        # 查找 ( 和 )
-        start_paren = after_at.find('(')
-        end_paren = after_at.find(')', start_paren)
-
-        if start_paren != -1 and end_paren != -1 and start_paren < end_paren:
-            # 找到了有效的 (qq)
-            qq = after_at[start_paren + 1:end_paren]  # 去掉括号
-            return yy, qq
-        else:
-            # 没有找到 (qq)，返回 yy 和 None
-            return yy, None
-    else:
-        # yy
-        return s_rest, None
+    # 只处理第二部分：例如 'yy@zz(qq)'
+    yy, at, after_at = s_rest.partition('@')
+    if not at:
+        return s_rest.strip(), None  # 只有 yy（容忍首尾多余空白）
+
+    # 剩下的部分是 zz(qq) 或 zz：查找 ( 和其后的 )
+    start_paren = after_at.find('(')
+    end_paren = after_at.find(')', start_paren + 1) if start_paren != -1 else -1
+    if end_paren != -1:
+        # 找到了有效的 (qq)，去掉括号与空白
+        return yy.strip(), after_at[start_paren + 1:end_paren].strip()
+    # 没有找到 (qq)，返回 yy 和 None
+    return yy.strip(), None
 
 
 
+# 日期格式正则（模块加载时编译一次）
+_STD_DASH_DATE_RE = re.compile(r'^\d{4}-\d{1,2}-\d{1,2}$')  # 标准短横线格式（允许月份/日期为1-2位，如 "2024-08-15" 或 "2023-3-5"）
+_CN_DATE_RE = re.compile(r'^(\d{4})年(\d{1,2})月(\d{1,2})日$')  # 中文格式
+_SLASH_DATE_RE = re.compile(r'^(\d{4})/(\d{1,2})/(\d{1,2})$')  # 斜杠格式
+
 def preprocess_date_str(raw_str: str) -> str:
     """
     预处理日期字符串，标准短横线格式直接返回，其他格式转换为 YYYY-MM-DD（补前导零）
@@ -79,14 +67,11 @@ def preprocess_date_str(raw_str: str) -> str:
         return ""  # 空字符串直接返回
 
     # -------------------- 步骤2：优先匹配标准短横线格式 --------------------
-    # 标准短横线格式正则（允许月份/日期为1-2位，如 "2024-08-15" 或 "2023-3-5"）
-    std_dash_pattern = r'^\d{4}-\d{1,2}-\d{1,2}$'
-    if re.fullmatch(std_dash_pattern, cleaned):
+    if _STD_DASH_DATE_RE.fullmatch(cleaned):
         return cleaned  # 标准格式直接返回
 
     # -------------------- 步骤3：匹配中文格式（YYYY年MM月DD日） --------------------
-    cn_pattern = r'^(\d{4})年(\d{1,2})月(\d{1,2})日$'
-    cn_match = re.fullmatch(cn_pattern, cleaned)
+    cn_match = _CN_DATE_RE.fullmatch(cleaned)
     if cn_match:
         year = cn_match.group(1)
         month = f"{int(cn_match.group(2)):02d}"  # 补前导零（如 3 → "03"）
@@ -94,8 +79,7 @@ def preprocess_date_str(raw_str: str) -> str:
         return f"{year}-{month}-{day}"
 
     # -------------------- 步骤4：匹配斜杠格式（YYYY/MM/DD） --------------------
-    slash_pattern = r'^(\d{4})/(\d{1,2})/(\d{1,2})$'
-    slash_match = re.fullmatch(slash_pattern, cleaned)
+    slash_match = _SLASH_DATE_RE.fullmatch(cleaned)
     if slash_match:
         year = slash_match.group(1)
         month = f"{int(slash_match.group(2)):02d}"  # 补前导零
@@ -106,6 +90,16 @@ def preprocess_date_str(raw_str: str) -> str:
     return cleaned  # 或 raise ValueError(f"不支持的日期格式: {raw_str}")
 
 
+def _parse_date(date_str: str) -> date:
+    """
+    解析 YYYY-MM-DD 日期字符串：补零的标准格式走 C 实现的 date.fromisoformat，
+    未补零的旧格式（如 "2023-3-5"）回退到 strptime
+    """
+    try:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+
 def calculate_delta_days(today_str: str, last_sign_str: str) -> int:
     """
     计算两个日期字符串之间的间隔天数（自然日差）
@@ -114,13 +108,10 @@ def calculate_delta_days(today_str: str, last_sign_str: str) -> int:
     :param last_sign_str: 上次签到日期字符串（格式：YYYY-MM-DD）
     :return: 间隔天数（正数表示上次签到在今日之前，负数表示之后）
     """
-    # 定义日期格式（与输入字符串一致）
-    date_format = "%Y-%m-%d"
-
     try:
-        # 将字符串转换为 date 对象（自动去除时间部分）
-        today_date = datetime.strptime(today_str, date_format).date()
-        last_sign_date = datetime.strptime(last_sign_str, date_format).date()
+        # 将字符串转换为 date 对象
+        today_date = _parse_date(today_str)
+        last_sign_date = _parse_date(last_sign_str)
     except ValueError as e:
         raise ValueError(f"日期格式错误或无效: {e}") from e
 
@@ -128,6 +119,27 @@ def calculate_delta_days(today_str: str, last_sign_str: str) -> int:
     delta_days = (today_date - last_sign_date).days
     return delta_days
 
+# (当日零点时间戳, 次日零点时间戳, 当日日期字符串)；同一天内复用，跨过本地零点后重新计算
+_TODAY_CACHE: tuple[float, float, str] = (0.0, 0.0, "")
+
+def get_today_str(timestamp: Optional[float] = None) -> str:
+    """
+    获取本地日期字符串（格式：YYYY-MM-DD），同一天内直接返回缓存结果
+
+    :param timestamp: 时间戳（可选，默认当前时间；已取过时间戳的调用方可传入以保持同一时刻）
+    :return: 日期字符串（如 "2025-01-01"）
+    """
+    global _TODAY_CACHE
+    ts = time.time() if timestamp is None else timestamp
+    day_start, day_end, day_str = _TODAY_CACHE
+    if day_start <= ts < day_end:
+        return day_str
+    # 按本地时区的零点划分日期（不能用 ts // 86400，那是 UTC 日期）
+    midnight = datetime.fromtimestamp(ts).replace(hour=0, minute=0, second=0, microsecond=0)
+    day_str = midnight.strftime("%Y-%m-%d")
+    _TODAY_CACHE = (midnight.timestamp(), (midnight + timedelta(days=1)).timestamp(), day_str)
+    return day_str
+
 def get_dynamic_rob_ratio(victim_gold: int) -> float:
     if victim_gold <= 200:
         return 0.1   # 10%
@@ -142,6 +154,22 @@ def get_dynamic_rob_ratio(victim_gold: int) -> float:
     else:
         return 0.002  # 0.2%
 
+# 昵称缓存：(QQ号, 接口类型) -> (昵称, 过期时间戳)；仅缓存网络接口成功返回的昵称
+_NICKNAME_CACHE: dict[tuple[str, int], tuple[str, float]] = {}
+_NICKNAME_TTL = 3600  # 昵称缓存有效期（秒）
+_NICKNAME_CACHE_MAX = 1024  # 昵称缓存条目上限：达到上限时先清理过期条目，仍满则整体清空
+
+def _cache_nickname(qq_number: str, api_type: int, nickname: str) -> str:
+    """写入昵称缓存并原样返回昵称"""
+    now = time.monotonic()
+    if len(_NICKNAME_CACHE) >= _NICKNAME_CACHE_MAX:
+        for key in [key for key, (_, expires) in _NICKNAME_CACHE.items() if expires <= now]:
+            del _NICKNAME_CACHE[key]
+        if len(_NICKNAME_CACHE) >= _NICKNAME_CACHE_MAX:
+            _NICKNAME_CACHE.clear()
+    _NICKNAME_CACHE[(qq_number, api_type)] = (nickname, now + _NICKNAME_TTL)
+    return nickname
+
 async def get_qq_nickname(qq_number: str, api_type: int) -> str:
     """
     通过 QQ 号获取昵称或隐藏账号（支持多接口类型切换）
@@ -166,8 +194,13 @@ async def get_qq_nickname(qq_number: str, api_type: int) -> str:
         hidden_qq = f"{qq_number[:3]}{hidden_chars}{qq_number[-3:]}"
         return hidden_qq
 
+    # -------------------- 网络接口：优先命中缓存 --------------------
+    cached = _NICKNAME_CACHE.get((qq_number, api_type))
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
     # -------------------- 接口类型0：旧版头像接口 --------------------
-    elif api_type == 0:
+    if api_type == 0:
         url = f"http://users.qzone.qq.com/fcg-bin/cgi_get_portrait.fcg?uins={qq_number}"
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
@@ -213,7 +246,7 @@ async def get_qq_nickname(qq_number: str, api_type: int) -> str:
 
                     if not nickname:
                         return f"ℹ️ 旧版接口：无法提取昵称（用户信息数组：{user_info}）"
-                    return nickname
+                    return _cache_nickname(qq_number, api_type, nickname)
 
             except aiohttp.ClientError as e:
                 return f"🌐 网络请求异常（错误：{str(e)}）"
@@ -247,7 +280,7 @@ async def get_qq_nickname(qq_number: str, api_type: int) -> str:
                     nickname = data.get("name")
                     if not nickname or not isinstance(nickname, str):
                         return "ℹ️ 第三方接口：返回数据中未找到有效昵称"
-                    return nickname
+                    return _cache_nickname(qq_number, api_type, nickname)
 
             except aiohttp.ClientError as e:
                 return f"🌐 网络请求异常（错误：{str(e)}）"
@@ -2,18 +2,102 @@ import json
 import configparser
 import math
 from pathlib import Path
-from difflib import get_close_matches
+from difflib import SequenceMatcher
+import heapq
 import random
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
+import io
+import mmap
 import os
+import sys
 import tempfile
 from filelock import FileLock
 from collections import Counter, OrderedDict
+from contextlib import contextmanager
+
+try:
+    import orjson  # 可选依赖：安装后JSON读取与渔获数据保存改用 orjson（C实现，更快）
+except ImportError:
+    orjson = None
+
+_WRITE_BUF_SHRINK = 128 * 1024  # 写缓冲超过该大小（字符数）时用后丢弃，避免长期占用内存
+_MMAP_THRESHOLD = 1024 * 1024  # 不小于该大小（字节）的JSON文件用 mmap 读取
+_SUMMARY_CACHE_MAX = 1024  # 渔获概览缓存条目上限，超出时整体清空
+_RENDER_CACHE_MAX = 1024  # 职位文本渲染缓存条目上限（键可能来自用户输入），超出时整体清空
+_MISSING = object()  # 区分“键不存在”与“值为 None/0”的哨兵
+
+def _file_signature(file_path: Path) -> Optional[Tuple[int, int]]:
+    """返回文件的 (mtime_ns, size) 签名，用于判断磁盘文件是否被修改；文件不存在时返回 None"""
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+# 锁文件路径 -> FileLock 实例：同一文件始终复用同一把锁，避免每次保存重新构造锁对象
+_FILE_LOCKS: Dict[str, FileLock] = {}
+
+def _get_file_lock(lock_path: Any, timeout: float = -1) -> FileLock:
+    """按锁文件路径获取（复用）FileLock 实例"""
+    key = str(lock_path)
+    lock = _FILE_LOCKS.get(key)
+    if lock is None:
+        lock = _FILE_LOCKS[key] = FileLock(key, timeout=timeout)
+    return lock
+
+def _load_json_file(file_path: Path, encoding: str = "utf-8") -> Any:
+    """
+    读取并解析JSON文件：小文件一次性读入字节后解码；大文件 mmap 映射后直接从映射内存解码，省去一份整文件大小的字节副本
+    :param file_path: JSON文件路径
+    :param encoding: 文件编码
+    :return: 解析结果
+    """
+    # orjson 只接受 UTF-8，其他编码仍走标准库
+    use_orjson = orjson is not None and encoding.lower().replace("-", "").replace("_", "") == "utf8"
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if use_orjson:
+                    with memoryview(mm) as view:  # orjson 可直接解析映射内存，无需复制
+                        return orjson.loads(view)
+                return json.loads(str(mm, encoding))
+        raw = f.read()
+        return orjson.loads(raw) if use_orjson else json.loads(raw.decode(encoding))
+
+def _atomic_write_bytes(file_path: Path, payload: bytes, fsync: bool = False) -> None:
+    """
+    原子化写入字节串：同目录临时文件 + os.write 整块写入 + os.replace 替换目标文件
+    :param file_path: 目标文件路径
+    :param payload: 完整文件内容
+    :param fsync: 替换前是否 fsync 临时文件（更可靠但更慢）
+    """
+    fd, temp_name = tempfile.mkstemp(dir=str(file_path.parent), prefix=f".{file_path.name}.tmp.")
+    try:
+        try:
+            view = memoryview(payload)
+            while view:  # os.write 可能只写入部分数据，循环直至写完
+                view = view[os.write(fd, view):]
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)  # Windows 必须关闭句柄才能重命名
+        os.replace(temp_name, str(file_path))
+    except BaseException:
+        try:
+            os.unlink(temp_name)  # 删除残留的临时文件
+        except OSError:
+            pass
+        raise
 
 class IniFileReader:
     """
     高效读写INI文件的工具类，支持自动创建节、类型转换、异常处理
     """
+    __slots__ = (
+        "project_root", "subdir_name", "file_relative_path", "encoding",
+        "file_path", "_signature", "config", "_dirty", "_write_buf", "_sections",
+    )
+
     def __init__(
             self,
             project_root: Path,  # 显式传入最终数据目录的绝对路径（如 F:\...\Data）
@@ -26,7 +110,16 @@ class IniFileReader:
         self.file_relative_path = file_relative_path  # 文件名（相对于 project_root/subdir_name）
         self.encoding = encoding
         self.file_path = self._get_file_path()  # 完整文件绝对路径
+        self._signature = _file_signature(self.file_path)  # 加载时的文件签名（先于读取，避免漏判修改）
         self.config = self._load_config()     # 初始化时加载配置到内存
+        self._dirty = False  # 内存数据是否有未保存的修改
+        self._write_buf: Optional[io.StringIO] = None  # 序列化用写缓冲（save 时懒创建并复用）
+        self._sections: Dict[str, Dict[str, Any]] = {}  # 节名 -> 已做类型转换的键值（首次读取时解析，写入该节时失效）
+
+    @property
+    def signature(self) -> Optional[Tuple[int, int]]:
+        """内存数据对应的文件签名 (mtime_ns, size)（加载/保存时更新，文件不存在时为 None），供外部缓存判断数据是否变化"""
+        return self._signature
 
     def _get_file_path(self) -> Path:
         """构建INI文件的绝对路径（核心逻辑：project_root + subdir_name + file_relative_path）"""
@@ -45,7 +138,10 @@ class IniFileReader:
 
     def reload(self) -> None:
         """重新加载配置文件（覆盖内存数据）"""
+        self._signature = _file_signature(self.file_path)
         self.config = self._load_config()  # 重新加载文件到内存
+        self._dirty = False
+        self._sections.clear()
 
     def read_all(self) -> Dict[str, Dict[str, Any]]:
         """全量读取配置（返回内存中的最新数据）"""
@@ -60,9 +156,17 @@ class IniFileReader:
         """
         if not self.config.has_section(section):
             if create_if_not_exists:
+                # 仅在内存中建空节，不标记为已修改：之后若无实际写入，save 不会为空节重写文件
                 self.config.add_section(section)
             return {}
-        return self._parse_config(self.config)[section]
+        return dict(self._typed_section(section))  # 返回副本，调用方修改不影响缓存
+
+    def _typed_section(self, section: str) -> Dict[str, Any]:
+        """获取节的类型转换结果（调用方需保证节存在；返回缓存本身，只读使用）"""
+        typed = self._sections.get(section)
+        if typed is None:
+            typed = self._sections[section] = self._parse_section(self.config, section)
+        return typed
 
     def read_key(self, section: str, key: str, default: Any = None) -> Any:
         """
@@ -74,14 +178,30 @@ class IniFileReader:
         :return: 键对应的Python类型值；若键不存在且无默认值，抛出 ValueError
         :raises ValueError: 节或键不存在且未提供默认值时抛出异常
         """
-        section_data = self.read_section(section)
-        # 检查键是否存在
-        if key not in section_data:
+        # 只读访问，直接使用缓存的类型转换结果，无需复制整节
+        section_data = self._typed_section(section) if self.config.has_section(section) else {}
+        # 一次 get 同时完成存在性检查与取值
+        value = section_data.get(key, _MISSING)
+        if value is _MISSING:
             if default is not None:
                 return default
             raise ValueError(f"节 [{section}] 中无键 '{key}'")
 
-        return section_data[key]
+        return value
+
+    def read_key_all(self, key: str) -> Dict[str, Any]:
+        """
+        读取所有节中指定键的值（只转换该键，不解析整份文件）
+        :param key: 键名（如 "game_id"）
+        :return: {节名: 键值}；不含该键的节不出现在结果中
+        """
+        config = self.config
+        convert = self._convert_value
+        return {
+            section: convert(config.get(section, key))
+            for section in config.sections()
+            if config.has_option(section, key)
+        }
 
     def update_key(self, section: str, key: str, value: Any, encoding: Optional[str] = None) -> None:
         """
@@ -95,6 +215,8 @@ class IniFileReader:
             self.config.add_section(section)
         str_value = self._convert_to_ini_string(value)
         self.config.set(section, key, str_value)
+        self._sections.pop(section, None)
+        self._dirty = True
 
     def update_section_keys(self, section: str, data: Dict[str, Any], encoding: Optional[str] = None) -> None:
         """
@@ -108,66 +230,61 @@ class IniFileReader:
         # 构建临时字典，减少多次 set 操作
         temp_dict = {key: self._convert_to_ini_string(value) for key, value in data.items()}
         self.config[section].update(temp_dict)
+        self._sections.pop(section, None)
+        self._dirty = True
+
+    def update_many(self, data: Dict[str, Dict[str, Any]], encoding: Optional[str] = None) -> None:
+        """
+        跨节批量更新键值对（内存生效，需调用save保存）
+        :param data: {节名: {键: 值}}，节不存在则自动创建
+        :param encoding: 写入编码（可选）
+        """
+        for section, section_data in data.items():
+            self.update_section_keys(section, section_data)
 
     def save(self, encoding: Optional[str] = None) -> None:
         """
         原子化保存配置到文件（避免并发写入导致数据丢失）
+        内存数据自上次加载/保存后未被修改时直接返回，不重写文件
         :param encoding: 写入编码（可选）
         """
-        lock = FileLock(f"{self.file_path}.lock")
+        if not self._dirty:
+            return
+        # 加锁前先在内存中完成序列化，缩短持锁时间
+        payload = self._serialize(encoding or self.encoding)
+        lock = _get_file_lock(f"{self.file_path}.lock")
         with lock:
-            write_encoding = encoding or self.encoding
-            temp_file = None  # 临时文件句柄
-
             try:
-                # -------------------- 步骤1：创建临时文件 --------------------
-                # 在目标文件同目录下生成临时文件（使用相同前缀，避免跨目录问题）
-                temp_file = tempfile.NamedTemporaryFile(
-                    mode="w",
-                    encoding=write_encoding,
-                    dir=str(self.file_path.parent),  # 与目标文件同目录
-                    prefix=f".{self.file_path.name}.tmp.",  # 隐藏临时文件（可选）
-                    delete=False  # 手动控制删除（避免异常时残留）
-                )
-
-                # -------------------- 步骤2：写入临时文件 --------------------
-                self.config.write(temp_file)
-                temp_file.flush()  # 强制刷新缓冲区（确保数据写入磁盘）
-                os.fsync(temp_file.fileno())  # 同步文件元数据（可选，增强可靠性）
-
-                # -------------------- 步骤3：原子重命名 --------------------
-                # 替换原文件（操作系统保证原子性）
-                # 注意：Windows 需先关闭临时文件句柄才能重命名
-                if os.name == "nt":
-                    temp_file.close()  # Windows 必须关闭句柄才能重命名
-                    os.replace(temp_file.name, str(self.file_path))
-                else:
-                    os.replace(temp_file.name, str(self.file_path))  # Unix-like 直接替换
-
+                # 同目录临时文件整块写入并 fsync，再原子替换原文件（操作系统保证原子性）
+                _atomic_write_bytes(self.file_path, payload, fsync=True)
             except Exception as e:
-                # -------------------- 异常处理：清理临时文件 --------------------
-                if temp_file and os.path.exists(temp_file.name):
-                    try:
-                        os.unlink(temp_file.name)  # 删除残留的临时文件
-                    except Exception as cleanup_err:
-                        print(f"警告：清理临时文件失败 {temp_file.name}: {cleanup_err}")
-                # 抛出原始异常（或包装为自定义异常）
                 raise RuntimeError(f"原子化保存INI文件失败: {self.file_path}, 错误: {e}") from e
-
-            finally:
-                # 确保临时文件句柄关闭（避免资源泄漏）
-                if temp_file and not temp_file.closed:
-                    temp_file.close()
+            self._dirty = False
+            self._signature = _file_signature(self.file_path)
+
+    def _serialize(self, encoding: str) -> bytes:
+        """将内存配置序列化为字节串（复用实例级写缓冲，缓冲过大时用后丢弃）"""
+        buf = self._write_buf
+        if buf is None:
+            buf = self._write_buf = io.StringIO()
+        buf.seek(0)
+        buf.truncate()
+        self.config.write(buf)
+        payload = buf.getvalue().encode(encoding)
+        if buf.tell() > _WRITE_BUF_SHRINK:
+            self._write_buf = None
+        return payload
 
     @staticmethod
     def _parse_config(config: configparser.ConfigParser) -> Dict[str, Dict[str, Any]]:
         """将ConfigParser对象解析为嵌套字典（带类型转换）"""
-        parsed = {}
-        for section in config.sections():
-            parsed[section] = {}
-            for key, value in config.items(section):
-                parsed[section][key] = IniFileReader._convert_value(value)
-        return parsed
+        return {section: IniFileReader._parse_section(config, section) for section in config.sections()}
+
+    @staticmethod
+    def _parse_section(config: configparser.ConfigParser, section: str) -> Dict[str, Any]:
+        """仅解析单个节（带类型转换），读取单个用户数据时无需转换整份文件"""
+        convert = IniFileReader._convert_value
+        return {key: convert(value) for key, value in config.items(section)}
 
     @staticmethod
     def _convert_value(value: str) -> Any:
@@ -223,7 +340,9 @@ class BaseJsonFileHandler:
         self.file_relative_path = file_relative_path
         self.encoding = encoding
         self.file_path = self._get_file_path()
+        self._signature = _file_signature(self.file_path)  # 加载时的文件签名（先于读取，避免漏判修改）
         self.data = self._load_data()
+        self._dirty = False  # 是否有通过 update_data/__setitem__ 产生的未保存修改
 
     def _get_file_path(self) -> Path:
         return self.project_root / self.subdir_name / self.file_relative_path
@@ -235,33 +354,21 @@ class BaseJsonFileHandler:
                 json.dump({}, f, indent=4, ensure_ascii=False)
             return {}
         try:
-            with open(self.file_path, "r", encoding=self.encoding) as f:
-                return json.load(f)
+            return _load_json_file(self.file_path, self.encoding)
         except Exception as e:
             raise RuntimeError(f"加载JSON文件失败: {self.file_path}, 错误: {e}")
 
     def save(self, encoding: Optional[str] = None) -> None:
-        lock = FileLock(f"{self.file_path}.lock")
+        save_encoding = encoding if encoding is not None else self.encoding
+        payload = json.dumps(self.data, indent=4, ensure_ascii=False).encode(save_encoding)
+        lock = _get_file_lock(f"{self.file_path}.lock")
         with lock:
-            save_encoding = encoding if encoding is not None else self.encoding
             try:
-                temp_file = tempfile.NamedTemporaryFile(
-                    mode="w",
-                    encoding=save_encoding,
-                    dir=str(self.file_path.parent),
-                    prefix=f".{self.file_path.name}.tmp.",
-                    delete=False
-                )
-                with temp_file:
-                    json.dump(self.data, temp_file, indent=4, ensure_ascii=False)
-                os.replace(temp_file.name, str(self.file_path))
+                _atomic_write_bytes(self.file_path, payload)
             except Exception as e:
-                if 'temp_file' in locals() and os.path.exists(temp_file.name):
-                    try:
-                        os.unlink(temp_file.name)
-                    except Exception as cleanup_err:
-                        print(f"警告：清理临时文件失败 {temp_file.name}: {cleanup_err}")
                 raise RuntimeError(f"保存JSON文件失败: {self.file_path}, 错误: {e}")
+            self._dirty = False
+            self._signature = _file_signature(self.file_path)
 
     def update_data(
         self,
@@ -286,12 +393,14 @@ class BaseJsonFileHandler:
         if validate and expected_type is not None and not isinstance(value, expected_type):
             raise ValueError(f"键 '{last_key}' 的值类型应为 {expected_type.__name__}，当前为 {type(value).__name__}")
         current[last_key] = value
+        self._dirty = True
 
     def __getitem__(self, key: str) -> Any:
         return self.data[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.data[key] = value
+        self._dirty = True
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(file_path={self.file_path}, encoding={self.encoding})"
@@ -300,6 +409,99 @@ class JobFileHandler(BaseJsonFileHandler):
     """
     高效读写JSON文件的工具类、数据增删改查、层级信息提取
     """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 大类ID -> 按数值排序的职位ID列表、职位ID -> (大类ID, 排序位置)（首次使用时构建）
+        self._job_order: Optional[Tuple[Dict[str, List[str]], Dict[str, Tuple[str, int]]]] = None
+        self._all_job_ids: Optional[Tuple[str, ...]] = None  # 招聘市场用的全部职位ID（首次使用时构建）
+        # 公司 -> 职位名列表（按公司名排序）、展开后的 (公司, 职位名) 列表（首次使用时构建）
+        self._company_jobs: Optional[Tuple[Dict[str, List[str]], List[Tuple[str, str]]]] = None
+        self._rendered: Dict[Tuple[str, Any], str] = {}  # (视图名, 参数) -> 已渲染的展示文本
+
+    def update_data(self, *args, **kwargs) -> None:
+        super().update_data(*args, **kwargs)
+        self._invalidate_job_caches()
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._invalidate_job_caches()
+
+    def _invalidate_job_caches(self) -> None:
+        """数据变化后索引与已渲染页面全部失效"""
+        self._job_order = self._all_job_ids = self._company_jobs = None
+        self._rendered.clear()
+
+    def cached_render(self, view: str, key: Any, render: Callable[[], str]) -> str:
+        """
+        获取基于职位数据渲染的展示文本，职位数据变化前相同 (视图, 参数) 直接复用上次结果
+        :param view: 视图名（如 "job_hunting"、"check_job"）
+        :param key: 视图参数（如页码、职位ID），需可哈希
+        :param render: 未命中时调用的渲染函数
+        :return: 渲染后的文本
+        """
+        cache_key = (view, key)
+        text = self._rendered.get(cache_key)
+        if text is None:
+            text = render()
+            if len(self._rendered) >= _RENDER_CACHE_MAX:
+                self._rendered.clear()
+            self._rendered[cache_key] = text
+        return text
+
+    def _get_job_order(self) -> Tuple[Dict[str, List[str]], Dict[str, Tuple[str, int]]]:
+        """获取（必要时构建）各大类的职位排序索引"""
+        if self._job_order is None:
+            series_ids: Dict[str, List[str]] = {}
+            positions: Dict[str, Tuple[str, int]] = {}
+            for major_id, jobs in self.data.items():
+                if not isinstance(jobs, dict):
+                    continue
+                job_ids = sorted(jobs, key=int)
+                series_ids[major_id] = job_ids
+                for idx, jid in enumerate(job_ids):
+                    positions.setdefault(jid, (major_id, idx))  # 同一ID出现在多个大类时以首个为准
+            self._job_order = (series_ids, positions)
+        return self._job_order
+
+    def get_all_job_ids(self) -> Tuple[str, ...]:
+        """
+        获取所有有效职位ID（四位数字），先按大类、再按职位ID数值升序排列
+        :return: 职位ID元组（如 ("1000", "1001", "2000")），结果在数据变化前复用
+        """
+        if self._all_job_ids is None:
+            series_ids = self._get_job_order()[0]
+            self._all_job_ids = tuple(
+                job_id
+                for major_id in sorted(series_ids, key=int)
+                for job_id in series_ids[major_id]
+                if len(job_id) == 4 and job_id.isdigit()
+            )
+        return self._all_job_ids
+
+    def _get_company_jobs(self) -> Tuple[Dict[str, List[str]], List[Tuple[str, str]]]:
+        """获取（必要时构建）按公司分组的职位索引"""
+        if self._company_jobs is None:
+            grouped: Dict[str, List[str]] = {}
+            for job in self.get_all_jobs_and_companies():
+                grouped.setdefault(job["company"], []).append(job["jobName"])
+            grouped = {company: grouped[company] for company in sorted(grouped)}
+            flattened = [(company, job_name) for company, names in grouped.items() for job_name in names]
+            self._company_jobs = (grouped, flattened)
+        return self._company_jobs
+
+    def get_jobs_grouped_by_company(self) -> Dict[str, List[str]]:
+        """
+        获取按公司分组的职位名称（公司按名称排序，公司内保持数据原有顺序）
+        :return: {公司名: [职位名, ...]}，结果在数据变化前复用，调用方请勿修改
+        """
+        return self._get_company_jobs()[0]
+
+    def get_flattened_jobs(self) -> List[Tuple[str, str]]:
+        """
+        获取按公司名排序后展开的全部职位，供分页直接切片
+        :return: [(公司名, 职位名), ...]，结果在数据变化前复用，调用方请勿修改
+        """
+        return self._get_company_jobs()[1]
 
     def get_last_n_job_ids(self, job_id: str) -> List[str]:
         """
@@ -313,12 +515,9 @@ class JobFileHandler(BaseJsonFileHandler):
         if not isinstance(job_id, str) or len(job_id) != 4:
             return []
 
-        # 获取所属专业系列ID（如"10"）
+        # 获取所属专业系列ID（如"10"）下按数值排序的职位ID
         major_id = job_id[:2]
-        major_jobs = self.data.get(major_id, {})
-
-        # 提取所有职位ID并按数值排序
-        job_ids = sorted(major_jobs.keys(), key=lambda x: int(x))
+        job_ids = self._get_job_order()[0].get(major_id, [])
         n = len(job_ids)
 
         # 计算需要取的职位数量（总数量除以3，向上取整）
@@ -349,7 +548,8 @@ class JobFileHandler(BaseJsonFileHandler):
                 job_name = job_info.get("jobName")
                 company = job_info.get("company")
                 if job_name and company:  # 提前合并判断
-                    all_jobs.append({"jobName": job_name.strip(), "company": company.strip()})
+                    # 驻留字符串：同名公司/职位共用一个对象，节省内存且相等比较只需比较指针
+                    all_jobs.append({"jobName": sys.intern(job_name.strip()), "company": sys.intern(company.strip())})
         return all_jobs
 
     def get_job_info(self, job_id: str) -> Dict[str, Any]:
@@ -464,6 +664,11 @@ class JobFileHandler(BaseJsonFileHandler):
         :return: 可晋升的职位数量
         """
         major_id = job_id[:2]
+        series_ids, positions = self._get_job_order()
+        located = positions.get(job_id)
+        if located is not None and located[0] == major_id:
+            # 排序列表中位于当前职位之后的即为更高阶职位
+            return len(series_ids[major_id]) - located[1] - 1
         major_jobs = self.data.get(major_id, {})
         return sum(1 for job_key in major_jobs if job_key > job_id)
 
@@ -478,14 +683,23 @@ class JobFileHandler(BaseJsonFileHandler):
         major_id = job_id[:2]
         # 安全获取当前major下的职位字典，若不存在则为空
         major_jobs = self.data.get(major_id, {})
-        # 将职位键转换为整数并排序，确保按等级升序处理
-        sorted_job_ids = sorted(major_jobs.keys(), key=lambda x: int(x))
+        # 按等级升序处理（复用排序索引）
+        sorted_job_ids = self._get_job_order()[0].get(major_id, [])
         promote_chain = []
         for job_key in sorted_job_ids:
             if job_key > job_id:  # 若需排除当前职位，改为 job_key > job_id
                 promote_chain.append(major_jobs[job_key]["jobName"])
         return promote_chain
 
+    def get_promote_chain_str(self, job_id: str, sep: str = "→") -> str:
+        """
+        获取用分隔符连接的晋升链文本，职位数据变化前相同查询直接复用
+        :param job_id: 当前职位ID（如"2000"）
+        :param sep: 职位名称之间的分隔符
+        :return: 晋升链文本（如 "初级工程师→中级工程师"）
+        """
+        return self.cached_render("promote_chain", (job_id, sep), lambda: sep.join(self.get_promote_chain(job_id)))
+
     def get_next_job_info(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
         根据当前职位 ID 返回下一个相邻职位的信息（按 ID 顺序）
@@ -493,40 +707,82 @@ class JobFileHandler(BaseJsonFileHandler):
         :return: 下一个职位的完整信息字典；若当前 ID 不存在或已是最后一个，返回 None
         """
 
-        # 获取所有职位系列（如 "10"/"20" 等大类）
-        job_series = self.data
-
-        # 遍历每个职位系列，查找当前 job_id 所在的系列
-        for major_id, jobs in job_series.items():
-            if not isinstance(jobs, dict):
-                continue  # 跳过非字典类型的子节点
-
-            # 将当前系列的职位按 ID 排序（确保顺序正确）
-            sorted_jobs = sorted(jobs.items(), key=lambda x: int(x[0]))  # 按 ID 数值排序（如 "1000" < "1001"）
-
-            # 提取排序后的 ID 列表和对应的职位信息
-            job_ids = [jid for jid, _ in sorted_jobs]
-            job_info_list = [info for _, info in sorted_jobs]
-
-            # 检查当前 job_id 是否在该系列中
-            if job_id in job_ids:
-                current_index = job_ids.index(job_id)
-                # 若存在下一个职位（非最后一个）
-                if current_index + 1 < len(job_ids):
-                    return job_info_list[current_index + 1]  # 返回下一个职位的完整信息
-                else:
-                    return None  # 当前是该系列最后一个职位
-
-        # 若遍历完所有系列仍未找到当前 job_id
+        # 通过排序索引直接定位当前 job_id 所在系列及位置
+        series_ids, positions = self._get_job_order()
+        located = positions.get(job_id)
+        if located is not None:
+            major_id, current_index = located
+            job_ids = series_ids[major_id]
+            # 若存在下一个职位（非最后一个）
+            if current_index + 1 < len(job_ids):
+                return self.data[major_id][job_ids[current_index + 1]]  # 返回下一个职位的完整信息
+            return None  # 当前是该系列最后一个职位
+
+        # 任何系列中都找不到当前 job_id
         return None
 
 class ShopFileHandler(BaseJsonFileHandler):
     """
     高效读写JSON文件的工具类、数据增删改查、层级信息提取
     """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._items_view: Optional[Tuple[Tuple[str, Dict[str, Any]], ...]] = None  # 全部商品（按数据原有顺序，首次使用时构建）
+        self._by_category: Optional[Dict[str, List[Tuple[str, Dict[str, Any]]]]] = None  # 类别 -> 按价格升序的商品列表
+        self._char_index: Optional[Dict[str, List[str]]] = None  # 字 -> 含该字的商品名（相似商品推荐时筛选候选用）
+
+    def update_data(self, *args, **kwargs) -> None:
+        super().update_data(*args, **kwargs)
+        self._invalidate_item_caches()
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._invalidate_item_caches()
+
+    def _invalidate_item_caches(self) -> None:
+        """数据变化后商品列表索引全部失效"""
+        self._items_view = self._by_category = self._char_index = None
+
+    def items_view(self) -> Tuple[Tuple[str, Dict[str, Any]], ...]:
+        """
+        获取全部商品（按数据原有顺序），供分页直接切片
+        :return: ((商品名, 商品详情), ...)，结果在数据变化前复用
+        """
+        if self._items_view is None:
+            self._items_view = tuple(self.data.items())
+        return self._items_view
+
+    def get_category_sorted(self, category: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        获取指定类别的商品，按价格升序排列（同价保持原顺序）
+        :param category: 类别键（如 "gift"、"fishing_rod"）
+        :return: [(商品名, 商品详情), ...]，无该类别时返回空列表；结果在数据变化前复用，调用方请勿修改
+        """
+        if self._by_category is None:
+            by_category: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+            for name, info in self.items_view():
+                by_category.setdefault(info.get("category"), []).append((name, info))
+            for items in by_category.values():
+                items.sort(key=lambda item: item[1]["price"])  # sort 为稳定排序
+            self._by_category = by_category
+        return self._by_category.get(category, [])
+
+    def _get_char_index(self) -> Dict[str, List[str]]:
+        """
+        获取商品名单字倒排索引，首次使用时构建，数据变化前复用
+        :return: 字 -> 含该字的商品名列表
+        """
+        if self._char_index is None:
+            char_index: Dict[str, List[str]] = {}
+            for name in self.data:
+                for char in set(name):
+                    char_index.setdefault(char, []).append(name)
+            self._char_index = char_index
+        return self._char_index
+
     def get_item_info(self, item_name: str) -> Optional[Dict[str, Any]]:
         """
-        根据商品名精确查找商品信息
+        根据商品名精确查找商品信息（等价于 data.get，插件内部直接使用 data.get；保留供外部调用）
 
         :param item_name: 商品名称（如"小心心"、"木鱼竿"）
         :return: 匹配的商品信息字典，若未找到返回None
@@ -553,38 +809,41 @@ class ShopFileHandler(BaseJsonFileHandler):
         if not isinstance(item_name, str) or len(item_name.strip()) == 0:
             return []  # 无效商品名
 
-        # 目标商品不存在于商店数据中
-        if item_name not in self.data:
-            return []
-
         # -------------------- 步骤1：获取名称相似的商品 --------------------
-        # 提取所有商品名称和详情
-        all_items = list(self.data.items())  # 格式：[(商品名, 商品详情), ...]
-        all_names = [name for name, _ in all_items]
-
-        # 使用difflib计算名称相似度（按相似度从高到低排序）
-        similar_names = get_close_matches(
-            word=item_name,
-            possibilities=all_names,
-            n=top_n_name,  # 最多取前top_n_name个
-            cutoff=similarity_threshold  # 相似度阈值
-        )
-
-        # 整理名称相似的商品（排除自身，补充数量信息）
+        # 与名称没有任何相同字的商品相似度必为 0，借助单字倒排索引只对有共同字的商品计算 difflib 相似度
+        char_index = self._get_char_index()
+        candidates = set()
+        for char in set(item_name):
+            candidates.update(char_index.get(char, ()))
+        candidates.discard(item_name)  # 跳过目标商品自身
+
+        # 评分方式与 difflib.get_close_matches 一致（先用两级快速上界过滤，再算精确 ratio）
+        matcher = SequenceMatcher()
+        matcher.set_seq2(item_name)
+        scored = []
+        for name in candidates:
+            matcher.set_seq1(name)
+            if (matcher.real_quick_ratio() >= similarity_threshold
+                    and matcher.quick_ratio() >= similarity_threshold):
+                score = matcher.ratio()
+                if score >= similarity_threshold:
+                    scored.append((score, name))
+
+        # 整理名称相似的商品（相似度从高到低，补充数量信息）
         name_similar_items = []
-        for name in similar_names:
-            if name == item_name:
-                continue  # 跳过目标商品自身
+        for _, name in heapq.nlargest(top_n_name, scored):
             item_detail = self.data[name].copy()  # 复制详情避免修改原始数据
             item_detail["quantity"] = item_detail.get("quantity", 0)  # 确保数量字段存在
             name_similar_items.append((name, item_detail))
 
+        # 目标商品不存在于商店数据中（如用户输错名称）：没有价格可比，只返回名称相似的商品
+        if item_name not in self.data:
+            return name_similar_items
+        all_items = self.items_view()  # 格式：((商品名, 商品详情), ...)，数据变化前复用
+
         # -------------------- 步骤2：获取价格相邻的商品 --------------------
-        # 按价格升序排序（价格相同则按原顺序稳定排序）
-        sorted_by_price = sorted(
-            all_items,
-            key=lambda x: (x[1]["price"], all_items.index((x[0], x[1])))
-        )
+        # 按价格升序排序（sorted 为稳定排序，价格相同时自然保持原顺序，无需再逐项 index 查找）
+        sorted_by_price = sorted(all_items, key=lambda x: x[1]["price"])
 
         # 查找目标商品在价格排序中的索引
         target_price_idx = next(
@@ -640,6 +899,17 @@ class FishFileHandler(BaseJsonFileHandler):
     """
     高效读写JSON文件的工具类、数据增删改查、层级信息提取
     """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._bait_index: Optional[Dict[str, List[Dict[str, Any]]]] = None  # 鱼饵 -> 可钓到的鱼（首次使用时构建）
+
+    def update_data(self, *args, **kwargs) -> None:
+        super().update_data(*args, **kwargs)
+        self._bait_index = None  # 数据变化后索引失效
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._bait_index = None
 
     def get_item_info(self, item_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -650,6 +920,15 @@ class FishFileHandler(BaseJsonFileHandler):
         """
         return self.data.get(item_name)
 
+    def _build_bait_index(self) -> Dict[str, List[Dict[str, Any]]]:
+        """按鱼饵分组鱼信息（保持文件中的鱼顺序）"""
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        for fish_name, fish_info in self.data.items():
+            entry = {fish_name: fish_info}
+            for bait in dict.fromkeys(fish_info.get("bait", [])):
+                index.setdefault(bait, []).append(entry)
+        return index
+
     def get_random_fish_by_bait(self, bait: str) -> Optional[Dict[str, Any]]:
         """
         根据指定鱼饵随机返回一条匹配的鱼信息
@@ -657,17 +936,79 @@ class FishFileHandler(BaseJsonFileHandler):
         :param bait: 鱼饵名称（如"蚯蚓"、"活虾"）
         :return: 匹配的鱼信息字典，若无匹配项返回None
         """
-        matching_fishes = []
-        for fish_name, fish_info in self.data.items():
-            if bait in fish_info.get("bait", []):
-                matching_fishes.append({fish_name: fish_info})
-
+        if self._bait_index is None:
+            self._bait_index = self._build_bait_index()
+        matching_fishes = self._bait_index.get(bait)
         if not matching_fishes:
             return None
 
         return random.choice(matching_fishes)
 
+# ------------------------------ 进程内读取器缓存 ------------------------------
+# 以文件绝对路径为键缓存已解析的读取器，磁盘签名 (mtime_ns, size) 未变化时直接复用，避免每条指令重复解析整个文件
+_INI_READER_CACHE: Dict[Path, IniFileReader] = {}
+_JSON_HANDLER_CACHE: Dict[Tuple[type, Path], BaseJsonFileHandler] = {}
+
+def get_ini_reader(
+        project_root: Path,
+        subdir_name: str,
+        file_relative_path: str,
+        encoding: str = "utf-8"
+) -> IniFileReader:
+    """
+    获取INI读取器（带缓存）：文件未被修改且缓存中无未保存修改时复用已解析的实例，否则重新加载
+    :param project_root: 数据目录的绝对路径
+    :param subdir_name: 子目录名（如 "City/Personal"）
+    :param file_relative_path: 文件名（如 "Briefly.info"）
+    :param encoding: 文件编码
+    :return: IniFileReader 实例
+    """
+    file_path = Path(project_root) / subdir_name / file_relative_path
+    reader = _INI_READER_CACHE.get(file_path)
+    # 存在未保存修改的实例可能仍被调用方持有，不能原地重载，直接换成新实例
+    if (reader is None or reader._dirty or reader.encoding != encoding
+            or reader._signature != _file_signature(file_path)):
+        reader = IniFileReader(project_root, subdir_name, file_relative_path, encoding)
+        _INI_READER_CACHE[file_path] = reader
+    return reader
+
+def get_json_handler(
+        handler_cls: type,
+        project_root: Path,
+        subdir_name: str,
+        file_relative_path: str,
+        encoding: str = "utf-8"
+) -> BaseJsonFileHandler:
+    """
+    获取JSON文件处理器（带缓存，规则同 get_ini_reader）
+    :param handler_cls: 处理器类（如 ShopFileHandler）
+    :return: handler_cls 实例
+    """
+    file_path = Path(project_root) / subdir_name / file_relative_path
+    key = (handler_cls, file_path)
+    handler = _JSON_HANDLER_CACHE.get(key)
+    if (handler is None or handler._dirty or handler.encoding != encoding
+            or handler._signature != _file_signature(file_path)):
+        handler = handler_cls(project_root, subdir_name, file_relative_path, encoding)
+        _JSON_HANDLER_CACHE[key] = handler
+    return handler
+
+@contextmanager
+def transaction(*managers):
+    """
+    批量提交多个读取器的修改：块内只改内存，正常退出时按传入顺序逐个保存（无修改的读取器 save 为空操作）；
+    块内抛出异常时不保存，异常原样抛出。注意：各文件分别原子替换，并非跨文件事务——
+    某个文件保存失败时，排在它之前的文件已经写入，不会回滚
+    :param managers: 参与本次提交的 IniFileReader / BaseJsonFileHandler 实例
+    """
+    yield
+    for manager in managers:
+        manager.save()
+
 class UnifiedCreelManager:
+    # (数据文件, 账号) -> (文件签名, 渔获概览)；所有实例共享，文件被改写后签名变化即自然失效
+    _summary_cache: Dict[Tuple[Path, str], Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
     def __init__(
         self,
         save_dir: Path,
@@ -697,8 +1038,7 @@ class UnifiedCreelManager:
         if not self.data_file.exists():
             return {}  # 默认空字典（无用户数据）
         try:
-            with open(self.data_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _load_json_file(self.data_file)
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"JSON解析失败（文件: {self.data_file}）: {e.msg}", e.doc, e.pos) from e
         except Exception as e:
@@ -706,10 +1046,14 @@ class UnifiedCreelManager:
 
     def _save_data(self, data: Dict[str, Dict]) -> bool:
         """原子化保存统一文件数据（顶层为字典：{account: user_data}）"""
-        lock = FileLock(self.lock_path, timeout=5)
+        # 紧凑格式一次性编码：json.dumps 在无缩进时走C编码器，json.dump(indent=4) 则逐片段走纯Python编码
+        if orjson is not None:
+            payload = orjson.dumps(data)  # 直接输出UTF-8字节
+        else:
+            payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        lock = _get_file_lock(self.lock_path, timeout=5)
         with lock:
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            _atomic_write_bytes(self.data_file, payload)
         return True
 
     def add_fish_weight(
@@ -755,6 +1099,16 @@ class UnifiedCreelManager:
             # 追加重量
             fish_record["weights"].append(weight)
 
+        # 增量更新聚合统计（旧数据无聚合时先由已有记录补建）
+        aggregate = user_data.get("aggregate")
+        if aggregate is None:
+            user_data["aggregate"] = self._build_aggregate(user_data["fish_records"])
+        else:
+            aggregate["total_catches"] += 1
+            aggregate["total_weight"] += weight
+            fish_weights = aggregate["fish_weights"]
+            fish_weights[fish_name] = fish_weights.get(fish_name, 0) + weight
+
         # 保存数据（可能抛出异常）
         self._save_data(data)
         return True
@@ -789,36 +1143,45 @@ class UnifiedCreelManager:
             - fish_weights: 每种鱼的总重量（键：鱼名，值：该鱼总重量，单位：重量单位）
         :raises ValueError: 用户不存在时抛出
         """
-        data = self._load_data()
-        user_data = data.get(account)
-        if not user_data:
-            raise ValueError(f"用户 {account} 不存在")
-
-        # 初始化概览字典（新增 fish_weights 字段）
-        summary = {
-            "total_catches": 0,
-            "total_weight": 0.0,
-            "fish_types": len(user_data["fish_records"]),
-            "fish_weights": {}  # 新增：每种鱼的总重量（键：鱼名，值：总重量）
-        }
+        # 数据文件未变化（签名一致）时直接返回缓存的概览，无需重新加载整个文件
+        signature = _file_signature(self.data_file)
+        cache_key = (self.data_file, account)
+        cached = self._summary_cache.get(cache_key)
+        if cached is not None and signature is not None and cached[0] == signature:
+            summary = cached[1]
+        else:
+            data = self._load_data()
+            user_data = data.get(account)
+            if not user_data:
+                raise ValueError(f"用户 {account} 不存在")
+
+            # 直接读取增量维护的聚合统计，无需遍历全部渔获记录（旧数据无聚合时现算）
+            aggregate = user_data.get("aggregate") or self._build_aggregate(user_data["fish_records"])
+            summary = {
+                "total_catches": aggregate["total_catches"],
+                "total_weight": aggregate["total_weight"],
+                "fish_types": len(aggregate["fish_weights"]),
+                "fish_weights": aggregate["fish_weights"]
+            }
+            if len(self._summary_cache) >= _SUMMARY_CACHE_MAX:
+                self._summary_cache.clear()
+            self._summary_cache[cache_key] = (signature, summary)
+        # 返回副本，避免调用方修改缓存内容
+        return {**summary, "fish_weights": dict(summary["fish_weights"])}
 
-        # 遍历每条鱼记录，累加统计值
-        for record in user_data["fish_records"]:
+    @staticmethod
+    def _build_aggregate(fish_records: List[Dict]) -> Dict[str, Any]:
+        """由渔获记录全量计算聚合统计（总次数、总重量、各鱼种总重量）"""
+        aggregate = {"total_catches": 0, "total_weight": 0.0, "fish_weights": {}}
+        fish_weights = aggregate["fish_weights"]
+        for record in fish_records:
             fish_name = record["fish_name"]
             weights = record["weights"]
             fish_total = sum(weights)  # 当前鱼的总重量
-
-            # 累加全局统计
-            summary["total_catches"] += len(weights)
-            summary["total_weight"] += fish_total
-
-            # 记录当前鱼的总重量（若已存在则累加，否则初始化）
-            if fish_name in summary["fish_weights"]:
-                summary["fish_weights"][fish_name] += fish_total
-            else:
-                summary["fish_weights"][fish_name] = fish_total
-
-        return summary
+            aggregate["total_catches"] += len(weights)
+            aggregate["total_weight"] += fish_total
+            fish_weights[fish_name] = fish_weights.get(fish_name, 0) + fish_total
+        return aggregate
 
     def calculate_total_amount(
             self,
@@ -898,8 +1261,18 @@ class UnifiedCreelManager:
         if fish_index == -1:
             raise ValueError(f"用户 {account} 不存在鱼 {fish_name}")
 
-        # 执行删除
-        del user_data["fish_records"][fish_index]
+        # 执行删除，并同步扣减聚合统计
+        removed = user_data["fish_records"].pop(fish_index)
+        aggregate = user_data.get("aggregate")
+        if aggregate is not None:
+            removed_total = sum(removed["weights"])
+            aggregate["total_catches"] -= len(removed["weights"])
+            aggregate["total_weight"] -= removed_total
+            remaining = aggregate["fish_weights"].get(fish_name, 0) - removed_total
+            if any(fr["fish_name"] == fish_name for fr in user_data["fish_records"]):
+                aggregate["fish_weights"][fish_name] = remaining
+            else:
+                aggregate["fish_weights"].pop(fish_name, None)
 
         # 保存修改（可能抛出异常）
         self._save_data(data)